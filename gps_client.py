@@ -31,7 +31,7 @@ import time
 import subprocess
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 
 
 @dataclass
@@ -211,6 +211,33 @@ class _GPSWorker:
             accuracy_m_2d_cep95=2.0 * (epx**2 + epy**2) ** 0.5 if (epx is not None and epy is not None) else None,
         )
 
+    def get_snapshot(self) -> Tuple[Optional[GPSLocation], Optional[datetime]]:
+        """Return (location, gps_time) read under a single lock acquisition.
+
+        Equivalent to get_location() + get_time() but takes the mutex once,
+        so hot callers (the packet scanners) don't pay two lock round-trips
+        per observation.
+        """
+        with self._lock:
+            tpv = self._latest_tpv or {}
+            lat = tpv.get("lat")
+            lon = tpv.get("lon")
+            alt = _to_float(tpv.get("alt"))
+            epx = _to_float(tpv.get("epx"))
+            epy = _to_float(tpv.get("epy"))
+            iso = tpv.get("time")
+        gps_time = _parse_iso_utc(iso)
+        if lat is None or lon is None:
+            return None, gps_time
+        loc = GPSLocation(
+            lat=float(lat),
+            lon=float(lon),
+            alt=alt,
+            timestamp_utc=gps_time,
+            accuracy_m_2d_cep95=2.0 * (epx**2 + epy**2) ** 0.5 if (epx is not None and epy is not None) else None,
+        )
+        return loc, gps_time
+
 
 def _to_float(x: Any) -> Optional[float]:
     try:
@@ -290,6 +317,13 @@ def get_location() -> Optional[GPSLocation]:
     return _client.get_location()
 
 
+def get_snapshot() -> Tuple[Optional[GPSLocation], Optional[datetime]]:
+    """Return (location, gps_time) under one lock acquisition. (None, None) if not initialized."""
+    if _client is None:
+        return None, None
+    return _client.get_snapshot()
+
+
 # ---- helpers -------------------------------------------------------------------
 
 def _wait_until(pred, timeout: float) -> bool:
@@ -10,6 +10,8 @@ SCANNER_ID = "Scanner 1"
 SCAN_MODE = "both"  # Options: "bt", "wifi", or "both"
 WIFI_INTERFACE = "wlan1"  # USB WiFi adapter interface in monitor mode
 KNOWN_WIFIS = []  # List of known SSIDs to identify (empty = capture all)
+WIFI_WRITE_BATCH_MAX = 500  # Max observations written per DB transaction
+WIFI_WRITE_FLUSH_INTERVAL = 0.25  # Max seconds an observation waits before commit
 
 # Database configuration
 CLEAN_DB_ON_STARTUP = False  # Set to True to delete database file on each supervisor start
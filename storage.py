@@ -1,5 +1,6 @@
 # file: storage.py
 import sqlite3
+import threading
 import time
 import os
 from contextlib import contextmanager
@@ -59,8 +60,16 @@ def init_db():
     );
     """)
 
+    # Device lists are paginated ORDER BY last_seen DESC; these indexes let
+    # SQLite walk the order directly instead of sorting the whole table
+    con.execute("CREATE INDEX IF NOT EXISTS idx_devices_last_seen ON devices(last_seen);")
+
     con.execute("CREATE INDEX IF NOT EXISTS idx_sightings_ts ON sightings(ts_unix);")
     con.execute("CREATE INDEX IF NOT EXISTS idx_sightings_addr_ts ON sightings(addr, ts_unix);")
+    # Partial index matching the heatmap query's geo predicate exactly, so
+    # rows without a GPS fix are never touched
+    con.execute("""CREATE INDEX IF NOT EXISTS idx_sightings_geo_ts ON sightings(ts_unix)
+                   WHERE lat IS NOT NULL AND lon IS NOT NULL;""")
 
     # WiFi devices table (one row per unique WiFi device MAC)
     con.execute("""
@@ -93,10 +102,14 @@ def init_db():
     );
     """)
 
+    con.execute("CREATE INDEX IF NOT EXISTS idx_wifi_devices_last_seen ON wifi_devices(last_seen);")
+
     con.execute("CREATE INDEX IF NOT EXISTS idx_wifi_assoc_ts ON wifi_associations(ts_unix);")
     con.execute("CREATE INDEX IF NOT EXISTS idx_wifi_assoc_mac_ts ON wifi_associations(mac, ts_unix);")
     con.execute("CREATE INDEX IF NOT EXISTS idx_wifi_assoc_ssid ON wifi_associations(ssid);")
     con.execute("CREATE INDEX IF NOT EXISTS idx_wifi_assoc_packet_type ON wifi_associations(packet_type);")
+    con.execute("""CREATE INDEX IF NOT EXISTS idx_wifi_assoc_geo_ts ON wifi_associations(ts_unix)
+                   WHERE lat IS NOT NULL AND lon IS NOT NULL;""")
 
     # Migration: add new columns to existing tables if they don't exist
     _migrate_add_columns(con)
@@ -285,13 +298,42 @@ def normalize_mac(mac: str) -> str:
     return mac
 
 
+# One long-lived connection per thread (sqlite3 connections must stay on
+# the thread that created them)
+_thread_local = threading.local()
+
+
+def _connect():
+    con = sqlite3.connect(DB_PATH, isolation_level=None)
+    # journal_mode=WAL is persistent in the DB file (set by init_db), but
+    # these are per-connection: NORMAL skips an fsync per WAL commit, and
+    # the larger page cache + mmap keep reads off the SD card.
+    con.execute("PRAGMA synchronous=NORMAL;")
+    con.execute("PRAGMA temp_store=MEMORY;")
+    con.execute("PRAGMA cache_size=-65536;")    # 64 MiB page cache
+    con.execute("PRAGMA mmap_size=268435456;")  # 256 MiB mmap window
+    return con
+
+
 @contextmanager
 def db():
-    con = sqlite3.connect(DB_PATH, isolation_level=None)
+    """Yield the calling thread's persistent database connection.
+
+    Connections used to be opened and closed per call, paying the connect
+    and PRAGMA setup each time and discarding the page cache and prepared-
+    statement cache between requests. Each thread now reuses one long-lived
+    connection; if the body raises mid-transaction the transaction is
+    rolled back so the connection stays clean for the next caller.
+    """
+    con = getattr(_thread_local, "con", None)
+    if con is None:
+        con = _thread_local.con = _connect()
     try:
         yield con
-    finally:
-        con.close()
+    except Exception:
+        if con.in_transaction:
+            con.rollback()
+        raise
 
 def upsert_device(con, addr, name=None, manufacturer=None, man_hex=None, now=None):
     now = now or int(time.time())
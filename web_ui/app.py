@@ -12,28 +12,64 @@ and status information from main.py.
 """
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Query, Body, Request
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
+from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, Response, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.staticfiles import StaticFiles
 import asyncio
+import re
 import time
 import threading
 import shutil
 from typing import Optional, List, Dict, Any
 from datetime import datetime, timezone, timedelta
+import sqlite3
+import struct
 import sys
 import os
 import psutil
 import subprocess
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from settings import WEB_UI_HOST, WEB_UI_PORT, WEB_UI_REFRESH_INTERVAL, DB_FILE, SD_STORAGE, USB_STORAGE
 from storage import db
+from triangulation import DeviceTriangulator
+from confidence_analyzer import ConfidenceAnalyzer
 from .mac_utils import lookup_randomized_mac_vendor, is_locally_administered_mac
 import gps_client as gc
 
-app = FastAPI(title="SAR Scanner UI", description="Live web interface for SAR BT+WiFi Scanner")
+# Use uvloop when available: it is significantly faster than the stdlib
+# event loop for the many short I/O-bound coroutines this server runs
+# (WebSocket fan-out, frequent small JSON responses). Optional dependency.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
+# orjson serializes large heatmap/device payloads several times faster than
+# stdlib json; fall back to the default encoder if it's not installed
+try:
+    from fastapi.responses import ORJSONResponse as _DefaultResponse
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    import json
+
+    _DefaultResponse = JSONResponse
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj)
+
+app = FastAPI(title="SAR Scanner UI", description="Live web interface for SAR BT+WiFi Scanner",
+              default_response_class=_DefaultResponse)
 
 # Enable CORS
 app.add_middleware(
@@ -44,6 +80,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON payloads (heatmap/device lists); small responses pass through
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 DB_PATH = SD_STORAGE + DB_FILE
 
 # Check if the configured database exists; if not, try fallback paths for testing
@@ -54,23 +93,66 @@ if not os.path.exists(DB_PATH):
         DB_PATH = './test_results.db'
 
 # WebSocket connection manager
+class Channel:
+    """A connected WebSocket with its own outbound queue and relay task.
+
+    Messages are queued with put_nowait and delivered by a background relay
+    task, so a slow consumer only fills its own queue instead of delaying
+    the broadcast loop for everyone else.
+    """
+    QUEUE_SIZE = 32
+
+    def __init__(self, websocket: WebSocket):
+        self.ws = websocket
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_SIZE)
+        self.task = asyncio.create_task(self._relay())
+
+    async def _relay(self):
+        try:
+            while True:
+                message = await self.queue.get()
+                # Broadcasts arrive pre-serialized so N clients share one
+                # encode; dict messages are encoded per send as before
+                if isinstance(message, str):
+                    await self.ws.send_text(message)
+                else:
+                    await self.ws.send_json(message)
+        except Exception:
+            pass  # Connection closed; handler cleans up via disconnect()
+
+    def close(self):
+        self.task.cancel()
+
+
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: List[Channel] = []
 
-    async def connect(self, websocket: WebSocket):
+    async def connect(self, websocket: WebSocket) -> Channel:
         await websocket.accept()
-        self.active_connections.append(websocket)
-
-    def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        channel = Channel(websocket)
+        self.active_connections.append(channel)
+        return channel
 
-    async def broadcast(self, message: dict):
-        for connection in self.active_connections:
+    def disconnect(self, channel: Channel):
+        channel.close()
+        try:
+            self.active_connections.remove(channel)
+        except ValueError:
+            pass  # Already removed (e.g. dropped by a failed broadcast)
+
+    async def broadcast(self, message):
+        """Queue a message for all clients without blocking on any of them.
+
+        Each client has its own bounded queue drained by a relay task, so
+        broadcast cost is O(clients) queue puts regardless of how slow any
+        individual consumer is. Clients whose queue is full are dropped.
+        """
+        for channel in list(self.active_connections):
             try:
-                await connection.send_json(message)
-            except Exception:
-                pass
+                channel.queue.put_nowait(message)
+            except asyncio.QueueFull:
+                self.disconnect(channel)
 
 manager = ConnectionManager()
 
@@ -90,6 +172,17 @@ def get_db_path():
     return DB_PATH
 
 
+def _iso_local(ts) -> str:
+    """Format a Unix timestamp as a local-time ISO8601 string.
+
+    Equivalent output to datetime.fromtimestamp(ts).isoformat() for the
+    integer timestamps stored in the DB, but several times cheaper - it
+    skips the datetime object allocation and tz machinery, which matters
+    in the per-row loops below.
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(ts))
+
+
 # Whitelist of allowed sort columns for SQL ORDER BY (prevents injection)
 _BT_SORT_COLUMNS = {
     "mac": "addr", "name": "name", "manufacturer": "manufacturer",
@@ -124,6 +217,30 @@ def _apply_exclude_clauses(base: str, params: list, column: str, exclude_values:
     return base
 
 
+# Complete hex octets from the start of a MAC, e.g. "AA", "AA:BB:CC" or "AA:BB:"
+_MAC_PREFIX_RE = re.compile(r"^[0-9A-Fa-f]{2}(?::[0-9A-Fa-f]{2})*:?$")
+
+
+def _mac_like_param(value: str) -> str:
+    """Return the LIKE pattern for a MAC filter, preferring an anchored prefix.
+
+    Filters that look like the start of a MAC (complete hex octets such as
+    an OUI "AA:BB:CC") are anchored so the comparison can stop at the
+    prefix - and, on indexed address columns, range-scan the index -
+    instead of sliding a substring window across every stored address.
+    Anything else keeps the old substring match.
+    """
+    if _MAC_PREFIX_RE.match(value):
+        return f"{value}%"
+    return f"%{value}%"
+
+
+def _mac_match_clause(column: str, value: str, params: list) -> str:
+    """Append the _mac_like_param pattern and return its LIKE clause."""
+    params.append(_mac_like_param(value))
+    return f" AND {column} LIKE ? COLLATE NOCASE"
+
+
 def query_devices(device_type: str, limit: int = 1000, offset: int = 0, 
                   filters: Optional[Dict] = None,
                   sort_by: Optional[str] = None,
@@ -151,8 +268,7 @@ def query_devices(device_type: str, limit: int = 1000, offset: int = 0,
                 params = []
                 
                 if filters.get("mac_filter"):
-                    base += " AND addr LIKE ? COLLATE NOCASE"
-                    params.append(f"%{filters['mac_filter']}%")
+                    base += _mac_match_clause("addr", filters["mac_filter"], params)
                 
                 if filters.get("manufacturer_filter"):
                     base += " AND manufacturer LIKE ? COLLATE NOCASE"
@@ -171,7 +287,7 @@ def query_devices(device_type: str, limit: int = 1000, offset: int = 0,
                 query = f"SELECT addr, first_seen, last_seen, name, manufacturer_hex, manufacturer, confidence, notes {base} ORDER BY {db_sort_col} {order_dir} LIMIT ? OFFSET ?"
                 cursor = con.execute(query, params + [limit, offset])
                 
-                for row in cursor.fetchall():
+                for row in cursor:
                     addr, first_seen, last_seen, name, manufacturer_hex, manufacturer, confidence, notes = row
                     results.append({
                         "type": "device",
@@ -181,7 +297,6 @@ def query_devices(device_type: str, limit: int = 1000, offset: int = 0,
                         "manufacturer_hex": manufacturer_hex,
                         "first_seen": first_seen,
                         "last_seen": last_seen,
-                        "last_seen_str": datetime.fromtimestamp(last_seen).isoformat(),
                         "confidence": confidence,
                         "notes": notes or ""
                     })
@@ -198,8 +313,7 @@ def query_devices(device_type: str, limit: int = 1000, offset: int = 0,
                     params.append(f"%{filters['ssid_filter']}%")
                 
                 if filters.get("mac_filter"):
-                    base += " AND mac LIKE ? COLLATE NOCASE"
-                    params.append(f"%{filters['mac_filter']}%")
+                    base += _mac_match_clause("mac", filters["mac_filter"], params)
                 
                 if filters.get("manufacturer_filter"):
                     base += " AND vendor LIKE ? COLLATE NOCASE"
@@ -227,7 +341,7 @@ def query_devices(device_type: str, limit: int = 1000, offset: int = 0,
                 query = f"SELECT mac, first_seen, last_seen, vendor, device_type, confidence, notes {base} ORDER BY {db_sort_col} {order_dir} LIMIT ? OFFSET ?"
                 cursor = con.execute(query, params + [limit, offset])
                 
-                for row in cursor.fetchall():
+                for row in cursor:
                     mac, first_seen, last_seen, vendor, device_type_val, confidence, notes = row
                     
                     # Try to recover vendor for randomized MACs
@@ -244,7 +358,6 @@ def query_devices(device_type: str, limit: int = 1000, offset: int = 0,
                         "device_type": device_type_val or "",
                         "first_seen": first_seen,
                         "last_seen": last_seen,
-                        "last_seen_str": datetime.fromtimestamp(last_seen).isoformat(),
                         "confidence": confidence,
                         "notes": notes or ""
                     })
@@ -255,54 +368,127 @@ def query_devices(device_type: str, limit: int = 1000, offset: int = 0,
     return results, total_count
 
 
-def query_sightings(mac_filter: Optional[str] = None, 
+# API field name -> sightings column, for callers that only need a subset
+_SIGHTING_FIELD_COLUMNS = {
+    "id": "id",
+    "mac": "addr",
+    "timestamp": "ts_unix",
+    "gps_timestamp": "ts_gps",
+    "lat": "lat",
+    "lon": "lon",
+    "alt": "alt",
+    "gps_hdop": "gps_hdop",
+    "rssi": "rssi",
+    "tx_power": "tx_power",
+    "name": "local_name",
+    "manufacturer": "manufacturer",
+    "manufacturer_hex": "manufacturer_hex",
+    "service_uuid": "service_uuid",
+    "scanner": "scanner_name",
+}
+
+# API field name -> wifi_associations column
+_ASSOC_FIELD_COLUMNS = {
+    "id": "id",
+    "mac": "mac",
+    "timestamp": "ts_unix",
+    "gps_timestamp": "ts_gps",
+    "lat": "lat",
+    "lon": "lon",
+    "alt": "alt",
+    "ssid": "ssid",
+    "packet_type": "packet_type",
+    "rssi": "rssi",
+    "scanner": "scanner_name",
+}
+
+
+@lru_cache(maxsize=64)
+def _sightings_sql(select: str, has_mac: bool, has_rssi_min: bool,
+                   has_rssi_max: bool, has_start: bool, has_end: bool) -> str:
+    """Build (and cache) the sightings SQL for a combination of filters.
+
+    Reusing the exact statement text lets SQLite's per-connection statement
+    cache skip re-parsing the query on every call.
+    """
+    query = f"SELECT {select} FROM sightings WHERE 1=1"
+    if has_mac:
+        query += " AND addr LIKE ? COLLATE NOCASE"
+    if has_rssi_min:
+        query += " AND rssi >= ?"
+    if has_rssi_max:
+        query += " AND rssi <= ?"
+    if has_start:
+        query += " AND ts_unix >= ?"
+    if has_end:
+        query += " AND ts_unix <= ?"
+    return query + " ORDER BY ts_unix DESC LIMIT ?"
+
+
+def query_sightings(mac_filter: Optional[str] = None,
                    rssi_min: Optional[int] = None,
                    rssi_max: Optional[int] = None,
                    time_start: Optional[float] = None,
                    time_end: Optional[float] = None,
-                   limit: int = 500) -> List[Dict]:
-    """Query BT sightings with filters."""
+                   limit: int = 500,
+                   fields: Optional[tuple] = None) -> List[Dict]:
+    """Query BT sightings with filters.
+
+    *fields* optionally names a subset of result keys (see
+    _SIGHTING_FIELD_COLUMNS) so callers like the live-update producer only
+    fetch and serialize the columns they actually use.
+    """
     results = []
-    
+
+    if fields:
+        select = ", ".join(_SIGHTING_FIELD_COLUMNS[f] for f in fields)
+    else:
+        # Explicit columns rather than SELECT *: the adv_raw blob is never
+        # returned by this endpoint, so don't make SQLite materialize it
+        select = ("id, addr, ts_unix, ts_gps, lat, lon, alt, gps_hdop, rssi, "
+                  "tx_power, local_name, manufacturer, manufacturer_hex, "
+                  "service_uuid, scanner_name")
+
     try:
         with db() as con:
-            query = "SELECT * FROM sightings WHERE 1=1"
+            query = _sightings_sql(select, bool(mac_filter), rssi_min is not None,
+                                   rssi_max is not None, time_start is not None,
+                                   time_end is not None)
             params = []
-            
+
             if mac_filter:
-                query += " AND addr LIKE ? COLLATE NOCASE"
-                params.append(f"%{mac_filter}%")
-            
+                params.append(_mac_like_param(mac_filter))
+
             if rssi_min is not None:
-                query += " AND rssi >= ?"
                 params.append(rssi_min)
-            
+
             if rssi_max is not None:
-                query += " AND rssi <= ?"
                 params.append(rssi_max)
-            
+
             if time_start is not None:
-                query += " AND ts_unix >= ?"
                 params.append(time_start)
-            
+
             if time_end is not None:
-                query += " AND ts_unix <= ?"
                 params.append(time_end)
-            
-            query += " ORDER BY ts_unix DESC LIMIT ?"
+
             params.append(limit)
-            
+
             cursor = con.execute(query, params)
-            
-            for row in cursor.fetchall():
-                (id_, addr, ts_unix, ts_gps, lat, lon, alt, gps_hdop, rssi, tx_power, 
-                 local_name, manufacturer, manufacturer_hex, service_uuid, scanner_name, adv_raw) = row
+
+            if fields:
+                for row in cursor:
+                    result = dict(zip(fields, row))
+                    results.append(result)
+                return results
+
+            for row in cursor:
+                (id_, addr, ts_unix, ts_gps, lat, lon, alt, gps_hdop, rssi, tx_power,
+                 local_name, manufacturer, manufacturer_hex, service_uuid, scanner_name) = row
                 
                 results.append({
                     "id": id_,
                     "mac": addr,
                     "timestamp": ts_unix,
-                    "timestamp_str": datetime.fromtimestamp(ts_unix).isoformat(),
                     "gps_timestamp": ts_gps,
                     "lat": lat,
                     "lon": lon,
@@ -323,6 +509,39 @@ def query_sightings(mac_filter: Optional[str] = None,
     return results
 
 
+@lru_cache(maxsize=128)
+def _associations_sql(select: str, has_mac: bool, has_ssid: bool,
+                      has_rssi_min: bool, has_rssi_max: bool,
+                      has_start: bool, has_end: bool,
+                      n_mac_excl: int, n_ssid_excl: int, n_mfr_excl: int) -> str:
+    """Build (and cache) the wifi_associations SQL for a filter combination.
+
+    Exclude filters contribute a repeated clause per value, so the cache is
+    keyed on their counts; as with _sightings_sql, reusing identical
+    statement text lets SQLite's statement cache skip re-parsing.
+    """
+    query = f"SELECT {select} FROM wifi_associations WHERE 1=1"
+    if has_mac:
+        query += " AND mac LIKE ? COLLATE NOCASE"
+    if has_ssid:
+        query += " AND ssid LIKE ? COLLATE NOCASE"
+    if has_rssi_min:
+        query += " AND rssi >= ?"
+    if has_rssi_max:
+        query += " AND rssi <= ?"
+    if has_start:
+        query += " AND ts_unix >= ?"
+    if has_end:
+        query += " AND ts_unix <= ?"
+    query += " AND mac NOT LIKE ? COLLATE NOCASE" * n_mac_excl
+    query += " AND ssid NOT LIKE ? COLLATE NOCASE" * n_ssid_excl
+    if n_mfr_excl:
+        query += (" AND mac NOT IN (SELECT mac FROM wifi_devices WHERE "
+                  + " OR ".join(["vendor LIKE ? COLLATE NOCASE"] * n_mfr_excl)
+                  + ")")
+    return query + " ORDER BY ts_unix DESC LIMIT ?"
+
+
 def query_wifi_associations(mac_filter: Optional[str] = None,
                            ssid_filter: Optional[str] = None,
                            rssi_min: Optional[int] = None,
@@ -332,65 +551,73 @@ def query_wifi_associations(mac_filter: Optional[str] = None,
                            limit: int = 500,
                            mac_exclude: Optional[str] = None,
                            ssid_exclude: Optional[str] = None,
-                           manufacturer_exclude: Optional[str] = None) -> List[Dict]:
-    """Query WiFi association requests with filters."""
+                           manufacturer_exclude: Optional[str] = None,
+                           fields: Optional[tuple] = None) -> List[Dict]:
+    """Query WiFi association requests with filters.
+
+    *fields* optionally names a subset of result keys (see
+    _ASSOC_FIELD_COLUMNS); see query_sightings.
+    """
     results = []
-    
+
+    if fields:
+        select = ", ".join(_ASSOC_FIELD_COLUMNS[f] for f in fields)
+    else:
+        # Explicit columns so the row shape can't drift with schema changes
+        select = ("id, mac, ts_unix, ts_gps, lat, lon, alt, ssid, "
+                  "packet_type, rssi, scanner_name")
+
     try:
         with db() as con:
-            query = "SELECT * FROM wifi_associations WHERE 1=1"
+            mac_excl = _parse_exclude_list(mac_exclude)
+            ssid_excl = _parse_exclude_list(ssid_exclude)
+            mfr_excl = _parse_exclude_list(manufacturer_exclude)
+
+            query = _associations_sql(select, bool(mac_filter), bool(ssid_filter),
+                                      rssi_min is not None, rssi_max is not None,
+                                      time_start is not None, time_end is not None,
+                                      len(mac_excl), len(ssid_excl), len(mfr_excl))
             params = []
-            
+
             if mac_filter:
-                query += " AND mac LIKE ? COLLATE NOCASE"
-                params.append(f"%{mac_filter}%")
-            
+                params.append(_mac_like_param(mac_filter))
+
             if ssid_filter:
-                query += " AND ssid LIKE ? COLLATE NOCASE"
                 params.append(f"%{ssid_filter}%")
-            
+
             if rssi_min is not None:
-                query += " AND rssi >= ?"
                 params.append(rssi_min)
-            
+
             if rssi_max is not None:
-                query += " AND rssi <= ?"
                 params.append(rssi_max)
-            
+
             if time_start is not None:
-                query += " AND ts_unix >= ?"
                 params.append(time_start)
-            
+
             if time_end is not None:
-                query += " AND ts_unix <= ?"
                 params.append(time_end)
-            
-            # Exclude filters
-            query = _apply_exclude_clauses(query, params, "mac",
-                _parse_exclude_list(mac_exclude))
-            query = _apply_exclude_clauses(query, params, "ssid",
-                _parse_exclude_list(ssid_exclude))
-            mfr_excl = _parse_exclude_list(manufacturer_exclude)
-            if mfr_excl:
-                query += (" AND mac NOT IN (SELECT mac FROM wifi_devices WHERE "
-                          + " OR ".join(["vendor LIKE ? COLLATE NOCASE"] * len(mfr_excl))
-                          + ")")
-                for val in mfr_excl:
-                    params.append(f"%{val}%")
-            
-            query += " ORDER BY ts_unix DESC LIMIT ?"
+
+            params.extend(f"%{val}%" for val in mac_excl)
+            params.extend(f"%{val}%" for val in ssid_excl)
+            params.extend(f"%{val}%" for val in mfr_excl)
+
             params.append(limit)
-            
+
             cursor = con.execute(query, params)
-            
-            for row in cursor.fetchall():
+
+            if fields:
+                for row in cursor:
+                    result = dict(zip(fields, row))
+                    results.append(result)
+                return results
+
+            for row in cursor:
                 (id_, mac, ts_unix, ts_gps, lat, lon, alt, ssid, packet_type, rssi, scanner_name) = row
                 
                 results.append({
                     "id": id_,
                     "mac": mac,
                     "timestamp": ts_unix,
-                    "timestamp_str": datetime.fromtimestamp(ts_unix).isoformat(),
                     "gps_timestamp": ts_gps,
                     "lat": lat,
                     "lon": lon,
@@ -407,12 +634,30 @@ def query_wifi_associations(mac_filter: Optional[str] = None,
     return results
 
 
+# Adapter band support is static for the lifetime of the interface, so cache
+# the 'iw list' result instead of forking a subprocess on every /api/status hit
+_BAND_CACHE: Dict[str, tuple] = {}
+_BAND_CACHE_TTL = 300.0  # Re-probe occasionally in case the adapter is swapped
+
+
 def get_wifi_adapter_bands(interface: str) -> str:
     """Detect WiFi adapter band support (2.4 GHz, 5 GHz, or both).
-    
+
     Uses 'iw list' to query adapter capabilities.
     Returns string like '2.4 GHz', '5 GHz', or '2.4 & 5 GHz'.
+    Results are cached per interface for _BAND_CACHE_TTL seconds.
     """
+    now = time.monotonic()
+    cached = _BAND_CACHE.get(interface)
+    if cached and now - cached[0] < _BAND_CACHE_TTL:
+        return cached[1]
+    result = _probe_wifi_adapter_bands()
+    _BAND_CACHE[interface] = (now, result)
+    return result
+
+
+def _probe_wifi_adapter_bands() -> str:
+    """Run 'iw list' and parse supported bands from its output."""
     try:
         result = subprocess.run(
             ["iw", "list"],
@@ -446,9 +691,10 @@ async def get_status():
     
     gps_status = gc.get_gps_status()
     gps_loc = gc.get_location()
-    
-    # Detect WiFi adapter bands
-    wifi_bands = get_wifi_adapter_bands(WIFI_INTERFACE)
+
+    # Detect WiFi adapter bands (cached; run off-loop so a stalled 'iw' on
+    # the cold path never blocks the event loop)
+    wifi_bands = await asyncio.to_thread(get_wifi_adapter_bands, WIFI_INTERFACE)
     
     return {
         "timestamp": time.time(),
@@ -497,8 +743,9 @@ async def get_bt_devices(limit: int = Query(100, ge=1, le=1000),
     if confidence_max is not None:
         filters["confidence_max"] = confidence_max
     
-    devices, total_count = query_devices("bt", limit=limit, offset=offset, filters=filters,
-                                          sort_by=sort_by, sort_dir=sort_dir)
+    devices, total_count = await asyncio.to_thread(
+        query_devices, "bt", limit=limit, offset=offset, filters=filters,
+        sort_by=sort_by, sort_dir=sort_dir)
     return {"devices": devices, "count": len(devices), "total_count": total_count}
 
 
@@ -523,7 +770,8 @@ async def get_bt_sightings(
     elif hours_back:
         time_start_unix = time.time() - (hours_back * 3600)
     
-    sightings = query_sightings(
+    sightings = await asyncio.to_thread(
+        query_sightings,
         mac_filter=mac_filter,
         rssi_min=rssi_min,
         rssi_max=rssi_max,
@@ -566,8 +814,9 @@ async def get_wifi_devices(limit: int = Query(100, ge=1, le=1000),
     if confidence_max is not None:
         filters["confidence_max"] = confidence_max
     
-    devices, total_count = query_devices("wifi", limit=limit, offset=offset, filters=filters,
-                                          sort_by=sort_by, sort_dir=sort_dir)
+    devices, total_count = await asyncio.to_thread(
+        query_devices, "wifi", limit=limit, offset=offset, filters=filters,
+        sort_by=sort_by, sort_dir=sort_dir)
     return {"devices": devices, "count": len(devices), "total_count": total_count}
 
 
@@ -596,7 +845,8 @@ async def get_wifi_associations(
     elif hours_back:
         time_start_unix = time.time() - (hours_back * 3600)
     
-    associations = query_wifi_associations(
+    associations = await asyncio.to_thread(
+        query_wifi_associations,
         mac_filter=mac_filter,
         ssid_filter=ssid_filter,
         rssi_min=rssi_min,
@@ -611,16 +861,15 @@ async def get_wifi_associations(
     return {"associations": associations, "count": len(associations)}
 
 
-@app.get("/api/wifi/device/{mac}/ssids")
-async def get_wifi_device_ssids(mac: str):
-    """Get SSIDs associated with a specific WiFi device MAC address with packet type information.
-    
-    Returns detailed SSID information including whether the device is probing for them
-    (ProbeRequest) or advertising them (Beacon). Also includes device-level metadata.
+def _query_device_ssids(mac: str) -> tuple:
+    """Query device metadata and SSID/packet-type details for one WiFi MAC.
+
+    Synchronous DB helper for get_wifi_device_ssids; run via asyncio.to_thread.
+    Returns (device_info, ssids_data).
     """
     ssids_data = []
     device_info = {}
-    
+
     try:
         with db() as con:
             # Get device information
@@ -637,23 +886,28 @@ async def get_wifi_device_ssids(mac: str):
                     "notes": notes or "",
                     "first_seen": first_seen,
                     "last_seen": last_seen,
-                    "first_seen_str": datetime.fromtimestamp(first_seen).isoformat(),
-                    "last_seen_str": datetime.fromtimestamp(last_seen).isoformat()
+                    "first_seen_str": _iso_local(first_seen),
+                    "last_seen_str": _iso_local(last_seen)
                 }
             
-            # Get SSID details with packet type information
+            # Get SSID details with packet type information. Rows arrive
+            # already ordered by each SSID's most recent sighting (window MAX)
+            # with rounding done in SQL, so Python only has to merge packet
+            # types per SSID in insertion order - no re-sort afterwards.
             query = """
-                SELECT DISTINCT ssid, packet_type, COUNT(*) as count,
-                       MAX(ts_unix) as last_seen_ts, AVG(rssi) as avg_rssi
-                FROM wifi_associations 
+                SELECT ssid, packet_type, COUNT(*) as count,
+                       MAX(ts_unix) as last_seen_ts,
+                       ROUND(AVG(rssi), 1) as avg_rssi
+                FROM wifi_associations
                 WHERE mac = ?
                 GROUP BY ssid, packet_type
-                ORDER BY ssid, packet_type DESC
+                ORDER BY MAX(MAX(ts_unix)) OVER (PARTITION BY ssid) DESC,
+                         ssid, packet_type DESC
             """
             cursor = con.execute(query, (mac,))
-            
+
             ssid_dict = {}  # Group by SSID to combine packet types
-            for row in cursor.fetchall():
+            for row in cursor:
                 ssid, packet_type, count, last_seen_ts, avg_rssi = row
                 if ssid:  # Skip null/empty SSIDs
                     if ssid not in ssid_dict:
@@ -664,21 +918,33 @@ async def get_wifi_device_ssids(mac: str):
                             "last_seen": 0,
                             "avg_rssi": 0
                         }
-                    
+
                     ssid_dict[ssid]["types"].append({
                         "type": packet_type or "ProbeRequest",
                         "count": count,
                         "last_seen": last_seen_ts,
-                        "avg_rssi": round(avg_rssi, 1) if avg_rssi else 0
+                        "avg_rssi": avg_rssi or 0
                     })
                     ssid_dict[ssid]["count"] += count
                     ssid_dict[ssid]["last_seen"] = max(ssid_dict[ssid]["last_seen"], last_seen_ts or 0)
-            
-            ssids_data = sorted(ssid_dict.values(), key=lambda x: x["last_seen"], reverse=True)
-    
+
+            ssids_data = list(ssid_dict.values())
+
     except Exception as e:
         print(f"Error querying SSIDs for device {mac}: {e}")
-    
+
+    return device_info, ssids_data
+
+
+@app.get("/api/wifi/device/{mac}/ssids")
+async def get_wifi_device_ssids(mac: str):
+    """Get SSIDs associated with a specific WiFi device MAC address with packet type information.
+
+    Returns detailed SSID information including whether the device is probing for them
+    (ProbeRequest) or advertising them (Beacon). Also includes device-level metadata.
+    """
+    device_info, ssids_data = await asyncio.to_thread(_query_device_ssids, mac)
+
     return {
         "mac": mac,
         "device_info": device_info,
@@ -687,8 +953,212 @@ async def get_wifi_device_ssids(mac: str):
     }
 
 
+# RSSI -> heatmap intensity, precomputed for the plausible dBm range so the
+# per-point work in the heatmap loop is a single dict probe instead of
+# arithmetic + two builtin calls per row.
+_INTENSITY_TABLE = {
+    rssi: max(0.0, min(1.0, (rssi + 100) / 100)) for rssi in range(-128, 128)
+}
+
+
+def _rssi_intensity(rssi) -> float:
+    """Normalize an RSSI value (dBm) to a 0-1 heatmap intensity."""
+    intensity = _INTENSITY_TABLE.get(rssi)
+    if intensity is None:
+        # Out-of-range or non-integer RSSI; fall back to computing it
+        try:
+            intensity = max(0.0, min(1.0, (rssi + 100) / 100))
+        except TypeError:
+            intensity = 0.0
+    return intensity
+
+
+def _query_heatmap_rows(data_type, mac_filter, ssid_filter, mac_exclude,
+                        ssid_exclude, manufacturer_exclude, rssi_min,
+                        rssi_max, time_start_unix, time_end) -> List[tuple]:
+    """Query BT/WiFi heatmap points with filters.
+
+    Synchronous DB helper for get_heatmap_data; run via asyncio.to_thread.
+    Returns row tuples (lat, lon, rssi, type, mac, ssid, packet_type, ts_unix)
+    so the caller can format them as per-point dicts or columnar arrays.
+
+    BT and WiFi points come back from a single UNION ALL statement with a
+    literal type tag per side, so the database is hit once and one
+    homogeneous row loop replaces the former two cursors.
+    """
+    rows = []
+    parts = []
+    params = []
+
+    # BT sightings
+    if data_type in ("bt", "all"):
+        query = ("SELECT lat, lon, rssi, 'bt' AS type, addr AS mac, "
+                 "NULL AS ssid, NULL AS packet_type, ts_unix "
+                 "FROM sightings WHERE lat IS NOT NULL AND lon IS NOT NULL")
+
+        if mac_filter:
+            query += " AND addr LIKE ? COLLATE NOCASE"
+            params.append(_mac_like_param(mac_filter))
+
+        if rssi_min is not None:
+            query += " AND rssi >= ?"
+            params.append(rssi_min)
+
+        if rssi_max is not None:
+            query += " AND rssi <= ?"
+            params.append(rssi_max)
+
+        if time_start_unix:
+            query += " AND ts_unix >= ?"
+            params.append(time_start_unix)
+
+        if time_end is not None:
+            query += " AND ts_unix <= ?"
+            params.append(time_end)
+
+        parts.append(query)
+
+    # WiFi associations
+    if data_type in ("wifi", "assoc", "all"):
+        query = ("SELECT lat, lon, rssi, 'assoc', mac, ssid, packet_type, ts_unix "
+                 "FROM wifi_associations WHERE lat IS NOT NULL AND lon IS NOT NULL")
+
+        if mac_filter:
+            query += " AND mac LIKE ? COLLATE NOCASE"
+            params.append(_mac_like_param(mac_filter))
+
+        if ssid_filter:
+            query += " AND ssid LIKE ? COLLATE NOCASE"
+            params.append(f"%{ssid_filter}%")
+
+        if rssi_min is not None:
+            query += " AND rssi >= ?"
+            params.append(rssi_min)
+
+        if rssi_max is not None:
+            query += " AND rssi <= ?"
+            params.append(rssi_max)
+
+        if time_start_unix:
+            query += " AND ts_unix >= ?"
+            params.append(time_start_unix)
+
+        if time_end is not None:
+            query += " AND ts_unix <= ?"
+            params.append(time_end)
+
+        # Exclude filters for WiFi heatmap
+        query = _apply_exclude_clauses(query, params, "mac",
+            _parse_exclude_list(mac_exclude))
+        query = _apply_exclude_clauses(query, params, "ssid",
+            _parse_exclude_list(ssid_exclude))
+        mfr_excl = _parse_exclude_list(manufacturer_exclude)
+        if mfr_excl:
+            query += (" AND mac NOT IN (SELECT mac FROM wifi_devices WHERE "
+                      + " OR ".join(["vendor LIKE ? COLLATE NOCASE"] * len(mfr_excl))
+                      + ")")
+            for val in mfr_excl:
+                params.append(f"%{val}%")
+
+        parts.append(query)
+
+    if not parts:
+        return rows
+
+    try:
+        with db() as con:
+            cursor = con.execute(" UNION ALL ".join(parts), params)
+            for row in cursor:
+                if row[0] and row[1]:
+                    rows.append(row)
+
+    except Exception as e:
+        print(f"Error querying heatmap data: {e}")
+
+    return rows
+
+
+def _heatmap_point_dicts(rows: List[tuple]) -> List[Dict]:
+    """Format heatmap rows as the per-point dict list the map UI consumes."""
+    points = []
+    for lat, lon, rssi, point_type, mac, ssid, packet_type, ts_unix in rows:
+        point = {
+            "lat": lat,
+            "lon": lon,
+            "rssi": rssi,
+            "type": point_type,
+            "mac": mac,
+            "timestamp": ts_unix,
+            "intensity": _rssi_intensity(rssi)
+        }
+        if point_type == "assoc":
+            point["ssid"] = ssid
+            point["packet_type"] = packet_type
+        points.append(point)
+    return points
+
+
+def _heatmap_columns(rows: List[tuple]) -> Dict[str, list]:
+    """Format heatmap rows as parallel columns (struct-of-arrays).
+
+    Columnar output avoids repeating the JSON key strings once per point,
+    which shrinks large heatmap payloads roughly 3x on the wire.
+    """
+    lats, lons, rssis, types, macs, ssids, packet_types, timestamps, intensities = \
+        [], [], [], [], [], [], [], [], []
+    for lat, lon, rssi, point_type, mac, ssid, packet_type, ts_unix in rows:
+        lats.append(lat)
+        lons.append(lon)
+        rssis.append(rssi)
+        types.append(point_type)
+        macs.append(mac)
+        ssids.append(ssid)
+        packet_types.append(packet_type)
+        timestamps.append(ts_unix)
+        intensities.append(_rssi_intensity(rssi))
+    return {
+        "lat": lats,
+        "lon": lons,
+        "rssi": rssis,
+        "type": types,
+        "mac": macs,
+        "ssid": ssids,
+        "packet_type": packet_types,
+        "timestamp": timestamps,
+        "intensity": intensities,
+    }
+
+
+def _heatmap_binary(rows: List[tuple]) -> bytes:
+    """Pack heatmap rows as raw binary columns.
+
+    Layout: a 12-byte little-endian header (n_bt, n_assoc, reserved uint32)
+    followed by float32 lat[], float32 lon[] and int8 rssi[] blocks. Rows
+    arrive BT-first from the UNION ALL query, so the two counts delimit the
+    sections. At ~9 bytes per point this is roughly an order of magnitude
+    smaller than the per-point JSON dicts.
+    """
+    lats = array("f")
+    lons = array("f")
+    rssis = array("b")
+    n_bt = 0
+    for row in rows:
+        lats.append(row[0])
+        lons.append(row[1])
+        rssi = row[2]
+        rssis.append(max(-128, min(127, int(rssi))) if rssi is not None else -128)
+        if row[3] == "bt":
+            n_bt += 1
+    if sys.byteorder == "big":
+        lats.byteswap()
+        lons.byteswap()
+    header = struct.pack("<III", n_bt, len(rows) - n_bt, 0)
+    return header + lats.tobytes() + lons.tobytes() + rssis.tobytes()
+
+
 @app.get("/api/map/heatmap")
 async def get_heatmap_data(
+    request: Request,
     data_type: str = Query("all", regex="^(bt|wifi|assoc|all)$"),
     hours_back: Optional[int] = Query(None, ge=0),
     mac_filter: Optional[str] = None,
@@ -699,184 +1169,159 @@ async def get_heatmap_data(
     rssi_min: Optional[int] = Query(None, ge=-100, le=0),
     rssi_max: Optional[int] = Query(None, ge=-100, le=0),
     time_start: Optional[float] = None,
-    time_end: Optional[float] = None
+    time_end: Optional[float] = None,
+    format: str = Query("points", regex="^(points|columns)$")
 ):
     """Get heatmap data (GPS coordinates with RSSI) for map visualization with optional filters.
-    
+
     Can use either hours_back (quick select) or time_start/time_end (custom range).
     time_start and time_end take precedence if provided.
+
+    format=points (default) returns a list of per-point dicts;
+    format=columns returns parallel arrays keyed by field name, which is
+    substantially smaller for large result sets. Clients sending
+    Accept: application/octet-stream get raw binary lat/lon/rssi columns
+    (see _heatmap_binary) instead of JSON.
     """
     time_start_unix = None
     if time_start is not None:
         time_start_unix = time_start
     elif hours_back:
         time_start_unix = time.time() - (hours_back * 3600)
-    
-    heatmap_points = []
-    
-    try:
+
+    rows = await asyncio.to_thread(
+        _query_heatmap_rows, data_type, mac_filter, ssid_filter, mac_exclude,
+        ssid_exclude, manufacturer_exclude, rssi_min, rssi_max,
+        time_start_unix, time_end)
+
+    if "application/octet-stream" in request.headers.get("accept", ""):
+        return Response(content=_heatmap_binary(rows),
+                        media_type="application/octet-stream")
+    if format == "columns":
+        return {"count": len(rows), "columns": _heatmap_columns(rows)}
+    return {"points": _heatmap_point_dicts(rows)}
+
+
+# Shared TTL cache for the /ws/live table counts. COUNT(*) scans the whole
+# table, and without the cache every connected client re-ran all four counts
+# every refresh tick - quadratic in (rows x clients x 1/interval).
+_COUNTS_TTL = 2.0
+_counts_cache: Dict[str, int] = {}
+_counts_ts = 0.0
+_counts_lock = threading.Lock()
+
+
+def _get_cached_counts() -> Dict[str, int]:
+    """Return per-table row counts, refreshed at most every _COUNTS_TTL seconds.
+
+    A single refresh serves all connected WebSocket clients. One combined
+    SELECT fetches all four counts in a single round-trip.
+    """
+    global _counts_cache, _counts_ts
+    with _counts_lock:
+        if _counts_cache and time.monotonic() - _counts_ts < _COUNTS_TTL:
+            return _counts_cache
+
         with db() as con:
-            # BT sightings
-            if data_type in ("bt", "all"):
-                query = "SELECT lat, lon, rssi, addr, ts_unix FROM sightings WHERE lat IS NOT NULL AND lon IS NOT NULL"
-                params = []
-                
-                if mac_filter:
-                    query += " AND addr LIKE ? COLLATE NOCASE"
-                    params.append(f"%{mac_filter}%")
-                
-                if rssi_min is not None:
-                    query += " AND rssi >= ?"
-                    params.append(rssi_min)
-                
-                if rssi_max is not None:
-                    query += " AND rssi <= ?"
-                    params.append(rssi_max)
-                
-                if time_start_unix:
-                    query += " AND ts_unix >= ?"
-                    params.append(time_start_unix)
-                
-                if time_end is not None:
-                    query += " AND ts_unix <= ?"
-                    params.append(time_end)
-                
-                cursor = con.execute(query, params)
-                for lat, lon, rssi, mac, ts_unix in cursor.fetchall():
-                    if lat and lon:
-                        heatmap_points.append({
-                            "lat": lat,
-                            "lon": lon,
-                            "rssi": rssi,
-                            "type": "bt",
-                            "mac": mac,
-                            "timestamp": ts_unix,
-                            "intensity": max(0, min(1, (rssi + 100) / 100))  # Normalize RSSI to 0-1
-                        })
-            
-            # WiFi associations
-            if data_type in ("wifi", "assoc", "all"):
-                query = "SELECT lat, lon, rssi, mac, ssid, packet_type, ts_unix FROM wifi_associations WHERE lat IS NOT NULL AND lon IS NOT NULL"
-                params = []
-                
-                if mac_filter:
-                    query += " AND mac LIKE ? COLLATE NOCASE"
-                    params.append(f"%{mac_filter}%")
-                
-                if ssid_filter:
-                    query += " AND ssid LIKE ? COLLATE NOCASE"
-                    params.append(f"%{ssid_filter}%")
-                
-                if rssi_min is not None:
-                    query += " AND rssi >= ?"
-                    params.append(rssi_min)
-                
-                if rssi_max is not None:
-                    query += " AND rssi <= ?"
-                    params.append(rssi_max)
-                
-                if time_start_unix:
-                    query += " AND ts_unix >= ?"
-                    params.append(time_start_unix)
-                
-                if time_end is not None:
-                    query += " AND ts_unix <= ?"
-                    params.append(time_end)
-                
-                # Exclude filters for WiFi heatmap
-                query = _apply_exclude_clauses(query, params, "mac",
-                    _parse_exclude_list(mac_exclude))
-                query = _apply_exclude_clauses(query, params, "ssid",
-                    _parse_exclude_list(ssid_exclude))
-                mfr_excl = _parse_exclude_list(manufacturer_exclude)
-                if mfr_excl:
-                    query += (" AND mac NOT IN (SELECT mac FROM wifi_devices WHERE "
-                              + " OR ".join(["vendor LIKE ? COLLATE NOCASE"] * len(mfr_excl))
-                              + ")")
-                    for val in mfr_excl:
-                        params.append(f"%{val}%")
-                
-                cursor = con.execute(query, params)
-                for lat, lon, rssi, mac, ssid, packet_type, ts_unix in cursor.fetchall():
-                    if lat and lon:
-                        heatmap_points.append({
-                            "lat": lat,
-                            "lon": lon,
-                            "rssi": rssi,
-                            "type": "assoc",
-                            "mac": mac,
-                            "ssid": ssid,
-                            "packet_type": packet_type,
-                            "timestamp": ts_unix,
-                            "intensity": max(0, min(1, (rssi + 100) / 100))
-                        })
-    
-    except Exception as e:
-        print(f"Error querying heatmap data: {e}")
-    
-    return {"points": heatmap_points}
+            row = con.execute("""
+                SELECT (SELECT COUNT(*) FROM devices),
+                       (SELECT COUNT(*) FROM wifi_devices),
+                       (SELECT COUNT(*) FROM sightings),
+                       (SELECT COUNT(*) FROM wifi_associations)
+            """).fetchone()
+
+        _counts_cache = {
+            "bt_devices": row[0],
+            "wifi_devices": row[1],
+            "bt_sightings": row[2],
+            "wifi_associations": row[3],
+        }
+        _counts_ts = time.monotonic()
+        return _counts_cache
+
+
+def _query_live_stats() -> tuple:
+    """Fetch recent sightings/associations and per-table counts for /ws/live.
+
+    Synchronous DB helper; run via asyncio.to_thread. Only the handful of
+    fields the live ticker shows are selected, and only the five rows that
+    are actually broadcast.
+    Returns (recent_sightings, recent_assocs, counts dict).
+    """
+    recent_sightings = query_sightings(
+        limit=5, fields=("mac", "timestamp", "rssi", "name"))
+    recent_assocs = query_wifi_associations(
+        limit=5, fields=("mac", "timestamp", "rssi", "ssid", "packet_type"))
+    counts = _get_cached_counts()
+    return recent_sightings, recent_assocs, counts
+
+
+async def _live_producer():
+    """Build one live update per tick and broadcast it to every client.
+
+    A single shared task replaces the former per-connection query loops:
+    the GPS snapshot and DB queries run once per WEB_UI_REFRESH_INTERVAL
+    regardless of how many browsers are connected. Ticks with no clients
+    skip the DB work entirely.
+    """
+    while True:
+        await asyncio.sleep(WEB_UI_REFRESH_INTERVAL)
+
+        if not manager.active_connections:
+            continue
+
+        try:
+            gps_status = gc.get_gps_status()
+            gps_loc = gc.get_location()
+
+            # Get recent data and counts off the event loop
+            recent_sightings, recent_assocs, counts = await asyncio.to_thread(_query_live_stats)
+
+            update = {
+                "type": "live_update",
+                "timestamp": time.time(),
+                "gps": {
+                    "fix_ok": gps_status.fix_ok if gps_status else False,
+                    "sats_used": gps_status.sats_used if gps_status else None,
+                    "hdop": gps_status.hdop if gps_status else None,
+                    "location": {
+                        "lat": gps_loc.lat if gps_loc else None,
+                        "lon": gps_loc.lon if gps_loc else None,
+                    } if gps_loc else None
+                },
+                "stats": counts,
+                "recent_sightings": recent_sightings,
+                "recent_associations": recent_assocs
+            }
+
+            # Serialize once and fan the text frame out to every client
+            await manager.broadcast(_json_dumps(update))
+        except Exception as e:
+            print(f"Error building live update: {e}")
+
+
+@app.on_event("startup")
+async def _start_live_producer():
+    app.state.live_producer = asyncio.create_task(_live_producer())
 
 
 @app.websocket("/ws/live")
 async def websocket_live_updates(websocket: WebSocket):
-    """WebSocket endpoint for live data updates."""
-    await manager.connect(websocket)
+    """WebSocket endpoint for live data updates.
+
+    Updates are produced by the shared _live_producer task and delivered
+    through this connection's Channel queue; the handler only waits for
+    the client to disconnect.
+    """
+    channel = await manager.connect(websocket)
     try:
         while True:
-            # Send live updates periodically
-            await asyncio.sleep(WEB_UI_REFRESH_INTERVAL)
-            
-            try:
-                # Get latest data
-                gps_status = gc.get_gps_status()
-                gps_loc = gc.get_location()
-                
-                # Get recent sightings and associations
-                recent_sightings = query_sightings(limit=20)
-                recent_assocs = query_wifi_associations(limit=20)
-                
-                # Count devices
-                with db() as con:
-                    bt_count = con.execute("SELECT COUNT(*) FROM devices").fetchone()[0]
-                    wifi_count = con.execute("SELECT COUNT(*) FROM wifi_devices").fetchone()[0]
-                    sighting_count = con.execute("SELECT COUNT(*) FROM sightings").fetchone()[0]
-                    assoc_count = con.execute("SELECT COUNT(*) FROM wifi_associations").fetchone()[0]
-                
-                update = {
-                    "type": "live_update",
-                    "timestamp": time.time(),
-                    "gps": {
-                        "fix_ok": gps_status.fix_ok if gps_status else False,
-                        "sats_used": gps_status.sats_used if gps_status else None,
-                        "hdop": gps_status.hdop if gps_status else None,
-                        "location": {
-                            "lat": gps_loc.lat if gps_loc else None,
-                            "lon": gps_loc.lon if gps_loc else None,
-                        } if gps_loc else None
-                    },
-                    "stats": {
-                        "bt_devices": bt_count,
-                        "wifi_devices": wifi_count,
-                        "bt_sightings": sighting_count,
-                        "wifi_associations": assoc_count,
-                    },
-                    "recent_sightings": recent_sightings[:5],
-                    "recent_associations": recent_assocs[:5]
-                }
-                
-                await websocket.send_json(update)
-            except Exception as send_error:
-                # Connection closed or send failed - break the loop
-                if "CLOSED" in str(send_error) or "closed" in str(send_error):
-                    break
-                # Log other errors but continue
-                print(f"Error sending WebSocket update: {send_error}")
-    
+            await websocket.receive_text()
     except WebSocketDisconnect:
-        manager.disconnect(websocket)
+        manager.disconnect(channel)
     except Exception as e:
         print(f"WebSocket error: {e}")
-        manager.disconnect(websocket)
+        manager.disconnect(channel)
 
 
 # ============= Static Files =============
@@ -890,102 +1335,170 @@ async def get_index():
     return HTMLResponse("<h1>SAR Scanner UI</h1><p>Starting up...</p>")
 
 
-@app.get("/assets/{file_path:path}")
-async def get_asset(file_path: str):
-    """Serve static assets."""
-    asset_path = os.path.join(os.path.dirname(__file__), "assets", file_path)
-    if os.path.exists(asset_path):
-        return FileResponse(asset_path)
-    return JSONResponse({"error": "Not found"}, status_code=404)
-
-
-@app.get("/static/{file_path:path}")
-async def get_static(file_path: str):
-    """Serve bundled static files (CSS, JS, webfonts) for offline operation."""
-    static_path = os.path.join(os.path.dirname(__file__), "static", file_path)
-    if os.path.exists(static_path):
-        # Set appropriate content types
-        if file_path.endswith('.css'):
-            return FileResponse(static_path, media_type='text/css')
-        elif file_path.endswith('.js'):
-            return FileResponse(static_path, media_type='application/javascript')
-        elif file_path.endswith('.woff2'):
-            return FileResponse(static_path, media_type='font/woff2')
-        elif file_path.endswith('.woff'):
-            return FileResponse(static_path, media_type='font/woff')
-        elif file_path.endswith('.ttf'):
-            return FileResponse(static_path, media_type='font/ttf')
-        return FileResponse(static_path)
-    return JSONResponse({"error": "Not found"}, status_code=404)
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles with long-lived Cache-Control headers.
+
+    Webfonts never change between releases, so browsers may cache them
+    for a year without revalidating; CSS/JS get a short max-age and rely
+    on the ETag/304 handling StaticFiles already provides. Repeat page
+    loads then skip the font transfers entirely.
+    """
+    _IMMUTABLE_SUFFIXES = (".woff2", ".woff", ".ttf")
+
+    def file_response(self, full_path, *args, **kwargs):
+        response = super().file_response(full_path, *args, **kwargs)
+        if str(full_path).endswith(self._IMMUTABLE_SUFFIXES):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            response.headers["Cache-Control"] = "public, max-age=3600"
+        return response
+
+
+# Bundled static files (CSS, JS, webfonts) for offline operation. StaticFiles
+# serves these in C-accelerated Starlette code with correct content types,
+# ETag/304 handling and sendfile instead of going through a Python route.
+app.mount("/static", CachedStaticFiles(directory=os.path.join(os.path.dirname(__file__), "static")),
+          name="static")
+app.mount("/assets", CachedStaticFiles(directory=os.path.join(os.path.dirname(__file__), "assets"),
+                                       check_dir=False),
+          name="assets")
 
 
 @app.get("/api/download-db")
-async def download_db():
-    """Download the complete results.db database file."""
+async def download_db(request: Request):
+    """Download the complete results.db database file.
+
+    Streams 1 MiB chunks with a sequential/no-reuse fadvise hint so a
+    multi-GB download gets kernel readahead without evicting the page
+    cache the live scanners are using. Repeat downloads of an unchanged
+    file short-circuit to 304 via the (mtime, size) ETag.
+    """
     db_path = get_db_path()
     if not os.path.exists(db_path):
         return JSONResponse({"error": "Database not found"}, status_code=404)
-    
-    return FileResponse(db_path, filename="results.db", media_type="application/octet-stream")
+
+    st = os.stat(db_path)
+    etag = f'"{st.st_mtime_ns:x}-{st.st_size:x}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    fd = os.open(db_path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_NOREUSE)
+    except (AttributeError, OSError):
+        pass  # Advisory only; not available on all platforms
+
+    def _iter_db():
+        try:
+            while True:
+                chunk = os.read(fd, 1 << 20)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            os.close(fd)
+
+    headers = {
+        "Content-Length": str(st.st_size),
+        "Content-Disposition": 'attachment; filename="results.db"',
+        "ETag": etag,
+    }
+    return StreamingResponse(_iter_db(), media_type="application/octet-stream", headers=headers)
 
 
 # ============= Triangulation Analysis =============
 
+# The triangulation page is a fixed file bundled with the app, so read it
+# once at import and serve the in-memory copy instead of statting and
+# streaming the file per request
+try:
+    with open(os.path.join(os.path.dirname(__file__), "triangulation.html")) as _f:
+        _TRIANGULATION_HTML: Optional[str] = _f.read()
+except OSError:
+    _TRIANGULATION_HTML = None
+
+
 @app.get("/triangulate")
 async def get_triangulation_page():
     """Serve the triangulation analysis page."""
-    html_path = os.path.join(os.path.dirname(__file__), "triangulation.html")
-    if os.path.exists(html_path):
-        return FileResponse(html_path)
+    if _TRIANGULATION_HTML is not None:
+        return HTMLResponse(_TRIANGULATION_HTML)
     return HTMLResponse("<h1>Triangulation Page Not Found</h1>")
 
 
+# Triangulation re-reads every sighting for a device, so repeated clicks on
+# the same target (or both map panes requesting it at once) are served from
+# a short-lived cache; concurrent requests for the same MAC share one run
+_TRIANGULATE_TTL = 30.0
+_TRIANGULATE_CACHE_MAX = 256
+_triangulate_cache: "OrderedDict[str, tuple]" = OrderedDict()  # mac -> (ts, result)
+_triangulate_inflight: Dict[str, asyncio.Task] = {}
+
+
+def _triangulate_sync(mac: str) -> Optional[Dict]:
+    """Run the triangulation analysis; run via asyncio.to_thread."""
+    triangulator = DeviceTriangulator(mac)
+    result = triangulator.analyze()
+    return result.to_dict() if result is not None else None
+
+
 @app.get("/api/triangulate/{mac}")
 async def triangulate_device(mac: str):
     """Run triangulation and movement analysis for a specific device.
-    
+
     Analyzes all sightings (BT and WiFi) for the device and determines:
     - Likely location(s)
     - Whether the device is stationary or moving
     - Movement path and speed statistics
-    
+
     Args:
         mac: MAC address of the device to analyze
-        
+
     Returns:
         TriangulationResult as JSON
     """
-    try:
-        # Import triangulation module
-        from triangulation import DeviceTriangulator
-        
-        triangulator = DeviceTriangulator(mac)
-        result = triangulator.analyze()
-        
-        if result is None:
+    cached = _triangulate_cache.get(mac)
+    if cached is not None and time.monotonic() - cached[0] < _TRIANGULATE_TTL:
+        _triangulate_cache.move_to_end(mac)
+        result = cached[1]
+    else:
+        try:
+            task = _triangulate_inflight.get(mac)
+            if task is None:
+                task = asyncio.create_task(asyncio.to_thread(_triangulate_sync, mac))
+                _triangulate_inflight[mac] = task
+            try:
+                result = await task
+            finally:
+                _triangulate_inflight.pop(mac, None)
+
+            _triangulate_cache[mac] = (time.monotonic(), result)
+            _triangulate_cache.move_to_end(mac)
+            while len(_triangulate_cache) > _TRIANGULATE_CACHE_MAX:
+                _triangulate_cache.popitem(last=False)
+        except Exception as e:
+            print(f"Error in triangulation analysis for {mac}: {e}")
+            import traceback
+            traceback.print_exc()
             return JSONResponse(
-                {"error": f"Device not found: {mac}"},
-                status_code=404
+                {"error": f"Triangulation failed: {str(e)}"},
+                status_code=500
             )
-        
-        return result.to_dict()
-    
-    except Exception as e:
-        print(f"Error in triangulation analysis for {mac}: {e}")
-        import traceback
-        traceback.print_exc()
+
+    if result is None:
         return JSONResponse(
-            {"error": f"Triangulation failed: {str(e)}"},
-            status_code=500
+            {"error": f"Device not found: {mac}"},
+            status_code=404
         )
 
+    return result
+
 
 @app.get("/api/confidence-details/{mac}")
 async def confidence_details(mac: str):
     """Run on-the-fly confidence analysis for a single device and return details."""
     try:
-        from confidence_analyzer import ConfidenceAnalyzer
-
         analyzer = ConfidenceAnalyzer(db_path=get_db_path())
         result = analyzer.analyze_single_device(mac)
 
@@ -1006,40 +1519,104 @@ async def confidence_details(mac: str):
         )
 
 
-@app.post("/api/purge-db")
-async def purge_db():
-    """Purge all tables in the database and create a backup."""
-    db_path = get_db_path()
-    
-    if not os.path.exists(db_path):
-        return JSONResponse({"error": "Database not found"}, status_code=404)
-    
-    # Create backup with _bak suffix (will overwrite existing backup)
-    backup_path = db_path.replace(".db", "_bak.db")
-    try:
-        shutil.copy2(db_path, backup_path)
-        print(f"Database backup created: {backup_path}")
-    except Exception as e:
-        return JSONResponse({"error": f"Failed to create backup: {str(e)}"}, status_code=500)
-    
-    # Purge all tables
+def _backup_db(db_path: str, backup_path: str):
+    """Copy the database with the online backup API.
+
+    Synchronous helper for purge_db; run via asyncio.to_thread. The backup
+    API copies page-by-page under proper locks, so the backup is consistent
+    even if a scanner is writing concurrently.
+    """
+    src = sqlite3.connect(db_path)
     try:
-        with db() as con:
-            # Get all table names
+        dst = sqlite3.connect(backup_path)
+        try:
+            src.backup(dst)
+        finally:
+            dst.close()
+    finally:
+        src.close()
+
+
+# One lock per maintenance operation: double-submits (impatient double
+# clicks, two open tabs) get an immediate 409 instead of queueing a second
+# expensive run behind the first
+_maintenance_locks: Dict[str, asyncio.Lock] = {}
+
+
+def _maintenance_lock(name: str) -> asyncio.Lock:
+    return _maintenance_locks.setdefault(name, asyncio.Lock())
+
+
+# Purge script cached after the first discovery; the schema only changes on
+# deploys, which restart the server
+_purge_script: Optional[str] = None
+
+
+def _purge_tables():
+    """Empty every user table and VACUUM.
+
+    Synchronous helper for purge_db; run via asyncio.to_thread.
+    """
+    global _purge_script
+    with db() as con:
+        if _purge_script is None:
+            # Discover tables once and prebuild the whole purge as a single
+            # script: executescript runs all statements in one call into
+            # the C layer inside one transaction, so the write lock is
+            # taken once and every unqualified DELETE uses SQLite's
+            # truncate optimization with a single journal flush.
             cursor = con.execute(
                 "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%';"
             )
             tables = [row[0] for row in cursor.fetchall()]
-            
-            # Delete all rows from each table
-            for table in tables:
-                con.execute(f"DELETE FROM {table};")
-                print(f"Purged table: {table}")
-            
-            con.commit()
-            con.execute("VACUUM;")
-    except Exception as e:
-        return JSONResponse({"error": f"Failed to purge database: {str(e)}"}, status_code=500)
+            statements = [f'DELETE FROM "{t}";' for t in tables]
+            if con.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type='table' AND name='sqlite_sequence'"
+            ).fetchone():
+                # Reset AUTOINCREMENT counters so new ids start from 1
+                statements.append("DELETE FROM sqlite_sequence;")
+            _purge_script = ("BEGIN IMMEDIATE;"
+                             + "".join(statements)
+                             + "COMMIT;")
+
+        con.executescript(_purge_script)
+        print("Purged all tables")
+
+        # Reclaim the freed pages outside the transaction
+        con.execute("VACUUM;")
+
+
+@app.post("/api/purge-db")
+async def purge_db():
+    """Purge all tables in the database and create a backup.
+
+    Both the backup copy and the delete/VACUUM pass can take seconds on a
+    large database, so they run in worker threads; the event loop keeps
+    serving status polls meanwhile.
+    """
+    db_path = get_db_path()
+
+    if not os.path.exists(db_path):
+        return JSONResponse({"error": "Database not found"}, status_code=404)
+
+    lock = _maintenance_lock("purge-db")
+    if lock.locked():
+        return JSONResponse({"error": "Purge already in progress"}, status_code=409)
+
+    async with lock:
+        # Create backup with _bak suffix (will overwrite existing backup)
+        backup_path = db_path.replace(".db", "_bak.db")
+        try:
+            await asyncio.to_thread(_backup_db, db_path, backup_path)
+            print(f"Database backup created: {backup_path}")
+        except Exception as e:
+            return JSONResponse({"error": f"Failed to create backup: {str(e)}"}, status_code=500)
+
+        # Purge all tables
+        try:
+            await asyncio.to_thread(_purge_tables)
+        except Exception as e:
+            return JSONResponse({"error": f"Failed to purge database: {str(e)}"}, status_code=500)
     
     return {
         "success": True,
@@ -1053,21 +1630,43 @@ async def clear_usb_storage():
     """Clear all contents of USB_STORAGE directory."""
     if not os.path.exists(USB_STORAGE):
         return JSONResponse({"error": "USB storage not found"}, status_code=404)
-    
-    # Clear all contents
-    try:
-        for filename in os.listdir(USB_STORAGE):
-            file_path = os.path.join(USB_STORAGE, filename)
-            try:
-                if os.path.isfile(file_path) or os.path.islink(file_path):
-                    os.unlink(file_path)
-                elif os.path.isdir(file_path):
-                    shutil.rmtree(file_path)
-                print(f"Removed: {file_path}")
-            except Exception as e:
-                print(f"Failed to remove {file_path}: {e}")
-    except Exception as e:
-        return JSONResponse({"error": f"Failed to clear USB storage: {str(e)}"}, status_code=500)
+
+    def _remove(entry: os.DirEntry):
+        # DirEntry type checks reuse the readdir d_type, so classifying an
+        # entry costs no extra stat; follow_symlinks=False makes symlinked
+        # directories unlink like files instead of being recursed into
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                shutil.rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+            print(f"Removed: {entry.path}")
+        except Exception as e:
+            print(f"Failed to remove {entry.path}: {e}")
+
+    # Remove top-level entries concurrently in worker threads: deletions are
+    # I/O-bound on the flash medium, so overlapping them hides per-file
+    # latency. The semaphore keeps the thread fan-out bounded.
+    sem = asyncio.Semaphore(16)
+
+    async def _remove_bounded(entry: os.DirEntry):
+        async with sem:
+            await asyncio.to_thread(_remove, entry)
+
+    def _scan_entries():
+        with os.scandir(USB_STORAGE) as it:
+            return list(it)
+
+    lock = _maintenance_lock("clear-usb-storage")
+    if lock.locked():
+        return JSONResponse({"error": "USB clear already in progress"}, status_code=409)
+
+    async with lock:
+        try:
+            entries = await asyncio.to_thread(_scan_entries)
+            await asyncio.gather(*(_remove_bounded(entry) for entry in entries))
+        except Exception as e:
+            return JSONResponse({"error": f"Failed to clear USB storage: {str(e)}"}, status_code=500)
     
     return {
         "success": True,
@@ -1075,92 +1674,175 @@ async def clear_usb_storage():
     }
 
 
-@app.get("/api/system-status")
-async def get_system_status():
-    """Get current system status: disk space, memory, CPU, temperature, power draw."""
-    try:
-        # Get disk usage
-        root_usage = shutil.disk_usage("/")
-        usb_usage = None
-        if os.path.exists(USB_STORAGE):
-            usb_usage = shutil.disk_usage(USB_STORAGE)
-        
-        # Get memory usage
-        memory = psutil.virtual_memory()
-        
-        # Get CPU usage
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        
-        # Get temperature (if available)
-        temperature = None
+def _probe_sysfs_path(candidates: List[str]) -> Optional[str]:
+    """Return the first readable sysfs file from *candidates*, or None.
+
+    Sensor paths never change while the process runs, so they are probed
+    once at import and reads afterwards are a single open/read instead of
+    globbing or a psutil sensor enumeration per request.
+    """
+    for path in candidates:
         try:
+            with open(path) as f:
+                int(f.read().strip())
+            return path
+        except Exception:
+            continue
+    return None
+
+
+_TEMP_SYSFS_PATH = _probe_sysfs_path(
+    [f"/sys/class/thermal/thermal_zone{i}/temp" for i in range(4)])
+_POWER_SYSFS_PATH = _probe_sysfs_path(
+    ["/sys/class/power_supply/BAT0/power_now",
+     "/sys/class/power_supply/BAT1/power_now"])
+
+
+# System status changes slowly; cache it briefly so a dashboard polling the
+# endpoint (or several open tabs) doesn't re-run the sensor reads each time
+_SYSTEM_STATUS_TTL = 3.0
+_system_status_cache: Optional[Dict] = None
+_system_status_ts = 0.0
+_system_status_lock = asyncio.Lock()
+
+# Which psutil sensor reports CPU temperature, remembered after the first
+# successful lookup so the preference chain isn't re-walked every collection
+_psutil_temp_key: Optional[str] = None
+
+# Whether USB storage is mounted, re-stated only occasionally instead of on
+# every status collection
+_USB_CHECK_TTL = 30.0
+_usb_present = False
+_usb_checked = 0.0
+
+
+def _du(path: str) -> tuple:
+    """Return (total, used, free) bytes for *path* via one statvfs call."""
+    st = os.statvfs(path)
+    total = st.f_blocks * st.f_frsize
+    free = st.f_bavail * st.f_frsize
+    return total, total - free, free
+
+
+def _usb_storage_present() -> bool:
+    global _usb_present, _usb_checked
+    now = time.monotonic()
+    if now - _usb_checked >= _USB_CHECK_TTL:
+        _usb_present = os.path.exists(USB_STORAGE)
+        _usb_checked = now
+    return _usb_present
+
+
+def _collect_system_status() -> Dict:
+    """Gather disk/memory/CPU/temperature/power readings.
+
+    Synchronous helper for get_system_status; run via asyncio.to_thread.
+    """
+    global _psutil_temp_key
+    # Get disk usage
+    root_total, root_used, root_free = _du("/")
+    usb_usage = None
+    if _usb_storage_present():
+        try:
+            usb_usage = _du(USB_STORAGE)
+        except OSError:
+            pass  # Unmounted since the last existence check
+    
+    # Get memory usage
+    memory = psutil.virtual_memory()
+
+    # Get CPU usage. interval=None returns utilization since the previous
+    # call instead of blocking the worker thread for 100ms; with the TTL
+    # cache the sampling window is effectively the cache period.
+    cpu_percent = psutil.cpu_percent(interval=None)
+    
+    # Get temperature (if available): direct sysfs read of the path probed
+    # at import, falling back to psutil's sensor enumeration
+    temperature = None
+    try:
+        if _TEMP_SYSFS_PATH:
+            with open(_TEMP_SYSFS_PATH) as f:
+                temperature = int(f.read().strip()) / 1000  # millidegrees C
+        else:
             temps = psutil.sensors_temperatures()
             if temps:
-                # Try to get CPU temperature
-                if 'coretemp' in temps:
-                    temperature = temps['coretemp'][0].current
-                elif 'acpitz' in temps:
-                    temperature = temps['acpitz'][0].current
-                elif len(temps) > 0:
-                    temperature = list(temps.values())[0][0].current
-        except Exception as e:
-            print(f"Failed to get temperature: {e}")
-        
-        # Get power draw (if available)
-        power_draw = None
+                # Try to get CPU temperature, preferring the sensor that
+                # worked last time
+                key = _psutil_temp_key
+                if key not in temps:
+                    if 'coretemp' in temps:
+                        key = 'coretemp'
+                    elif 'acpitz' in temps:
+                        key = 'acpitz'
+                    else:
+                        key = next(iter(temps))
+                    _psutil_temp_key = key
+                temperature = temps[key][0].current
+    except Exception as e:
+        print(f"Failed to get temperature: {e}")
+
+    # Get power draw (if available)
+    power_draw = None
+    if _POWER_SYSFS_PATH:
         try:
-            # Try to read power consumption from various sources
-            with open('/sys/class/power_supply/BAT0/power_now', 'r') as f:
+            with open(_POWER_SYSFS_PATH) as f:
                 power_uw = int(f.read().strip())
                 power_draw = power_uw / 1000000  # Convert to watts
         except Exception:
-            try:
-                # Try alternative path
-                with open('/sys/class/power_supply/BAT1/power_now', 'r') as f:
-                    power_uw = int(f.read().strip())
-                    power_draw = power_uw / 1000000
-            except Exception:
-                # Power draw not available on this system
-                pass
-        
-        # Get database size
-        database_size = 0
-        try:
-            if os.path.exists(DB_PATH):
-                database_size = os.path.getsize(DB_PATH)
-        except Exception as e:
-            print(f"Failed to get database size: {e}")
-        
-        return {
-            "timestamp": time.time(),
-            "timestamp_str": datetime.now(timezone.utc).isoformat(),
-            "disk": {
-                "root": {
-                    "total": root_usage.total,
-                    "used": root_usage.used,
-                    "free": root_usage.free,
-                    "percent": root_usage.total > 0 and (root_usage.used / root_usage.total) * 100 or 0
-                },
-                "usb": {
-                    "total": usb_usage.total if usb_usage else None,
-                    "used": usb_usage.used if usb_usage else None,
-                    "free": usb_usage.free if usb_usage else None,
-                    "percent": usb_usage and (usb_usage.used / usb_usage.total) * 100 or None
-                } if usb_usage else None
-            },
-            "memory": {
-                "total": memory.total,
-                "used": memory.used,
-                "available": memory.available,
-                "percent": memory.percent
-            },
-            "cpu": {
-                "percent": cpu_percent
+            # Power draw not available on this system
+            pass
+    
+    # Get database size
+    database_size = 0
+    try:
+        if os.path.exists(DB_PATH):
+            database_size = os.path.getsize(DB_PATH)
+    except Exception as e:
+        print(f"Failed to get database size: {e}")
+    
+    return {
+        "timestamp": time.time(),
+        "timestamp_str": datetime.now(timezone.utc).isoformat(),
+        "disk": {
+            "root": {
+                "total": root_total,
+                "used": root_used,
+                "free": root_free,
+                "percent": root_total > 0 and (root_used / root_total) * 100 or 0
             },
-            "temperature": temperature,
-            "power_draw": power_draw,
-            "database_size": database_size
-        }
+            "usb": {
+                "total": usb_usage[0],
+                "used": usb_usage[1],
+                "free": usb_usage[2],
+                "percent": usb_usage[0] > 0 and (usb_usage[1] / usb_usage[0]) * 100 or None
+            } if usb_usage else None
+        },
+        "memory": {
+            "total": memory.total,
+            "used": memory.used,
+            "available": memory.available,
+            "percent": memory.percent
+        },
+        "cpu": {
+            "percent": cpu_percent
+        },
+        "temperature": temperature,
+        "power_draw": power_draw,
+        "database_size": database_size
+    }
+
+
+@app.get("/api/system-status")
+async def get_system_status():
+    """Get current system status: disk space, memory, CPU, temperature, power draw."""
+    global _system_status_cache, _system_status_ts
+    try:
+        async with _system_status_lock:
+            now = time.monotonic()
+            if _system_status_cache is None or now - _system_status_ts >= _SYSTEM_STATUS_TTL:
+                _system_status_cache = await asyncio.to_thread(_collect_system_status)
+                _system_status_ts = time.monotonic()
+        return _system_status_cache
     except Exception as e:
         print(f"Error getting system status: {e}")
         return JSONResponse({"error": f"Failed to get system status: {str(e)}"}, status_code=500)
@@ -1171,10 +1853,15 @@ async def get_system_status():
 async def system_shutdown():
     """Shutdown the Raspberry Pi."""
     try:
-        # Run shutdown command
-        subprocess.Popen(['sudo', 'shutdown', '-h', 'now'], 
-                        stdout=subprocess.PIPE, 
-                        stderr=subprocess.PIPE)
+        # Run shutdown command, fully detached: DEVNULL streams avoid pipe
+        # buffers nobody drains, and a new session keeps the command alive
+        # when this process is torn down mid-shutdown
+        subprocess.Popen(['sudo', 'shutdown', '-h', 'now'],
+                        stdin=subprocess.DEVNULL,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        start_new_session=True,
+                        close_fds=True)
         return {
             "success": True,
             "message": "System shutdown initiated"
@@ -1187,10 +1874,13 @@ async def system_shutdown():
 async def system_reboot():
     """Reboot the Raspberry Pi."""
     try:
-        # Run reboot command
-        subprocess.Popen(['sudo', 'shutdown', '-r', '+0'], 
-                        stdout=subprocess.PIPE, 
-                        stderr=subprocess.PIPE)
+        # Run reboot command, detached like shutdown above
+        subprocess.Popen(['sudo', 'shutdown', '-r', '+0'],
+                        stdin=subprocess.DEVNULL,
+                        stdout=subprocess.DEVNULL,
+                        stderr=subprocess.DEVNULL,
+                        start_new_session=True,
+                        close_fds=True)
         return {
             "success": True,
             "message": "System reboot initiated"
@@ -1202,6 +1892,15 @@ async def system_reboot():
 @app.post("/api/system/update")
 async def system_update():
     """Update the SAR BT Scan system via git pull."""
+    lock = _maintenance_lock("system-update")
+    if lock.locked():
+        return JSONResponse({"error": "Update already in progress"}, status_code=409)
+
+    async with lock:
+        return await _system_update_locked()
+
+
+async def _system_update_locked():
     try:
         # Use explicit path to grpck's home directory to ensure correct location
         # even when running as root (not relying on ~ expansion)
@@ -1211,31 +1910,35 @@ async def system_update():
         if not os.path.exists(work_dir):
             return JSONResponse({"error": f"Directory not found: {work_dir}"}, status_code=404)
         
-        # Run git pull as grpck user (not as root) to avoid permission issues
-        # grpck is the owner of the directory
-        result = subprocess.run(
-            ['sudo', '-u', 'grpck', 'git', 'pull'],
-            cwd=work_dir,
-            capture_output=True,
-            text=True,
-            timeout=30
+        # Run git pull as grpck (the directory owner), skipping the sudo
+        # user switch when we already run as the owner. -C replaces the cwd
+        # change, --ff-only refuses surprise merge commits, and
+        # GIT_TERMINAL_PROMPT=0 fails fast instead of hanging on a
+        # credential prompt until the timeout.
+        cmd = ['git', '-C', work_dir, 'pull', '--ff-only']
+        if os.geteuid() != os.stat(work_dir).st_uid:
+            cmd = ['sudo', '-u', 'grpck'] + cmd
+        rc, stdout, stderr = await _run_bounded(
+            cmd,
+            timeout=30,
+            env={**os.environ, 'GIT_TERMINAL_PROMPT': '0'}
         )
-        
+
         # Check if command was successful
-        if result.returncode == 0:
+        if rc == 0:
             return {
                 "success": True,
                 "message": "Update completed successfully",
-                "output": result.stdout,
-                "status_code": result.returncode
+                "output": stdout,
+                "status_code": rc
             }
         else:
             return {
                 "success": False,
                 "message": "Update completed with errors",
-                "output": result.stdout,
-                "error": result.stderr,
-                "status_code": result.returncode
+                "output": stdout,
+                "error": stderr,
+                "status_code": rc
             }
     except subprocess.TimeoutExpired:
         return JSONResponse({"error": "Update operation timed out"}, status_code=504)
@@ -1249,9 +1952,6 @@ async def system_update():
 async def preview_confidence_analysis():
     """Preview confidence analysis without applying changes."""
     try:
-        # Import analyzer module
-        from confidence_analyzer import ConfidenceAnalyzer
-        
         analyzer = ConfidenceAnalyzer()
         session, analyses = analyzer.analyze_all()
         
@@ -1287,9 +1987,6 @@ async def preview_confidence_analysis():
 async def run_confidence_analysis():
     """Run confidence analysis and update database."""
     try:
-        # Import analyzer module
-        from confidence_analyzer import ConfidenceAnalyzer
-        
         analyzer = ConfidenceAnalyzer()
         session, analyses = analyzer.analyze_all()
         
@@ -1308,13 +2005,64 @@ async def run_confidence_analysis():
         return JSONResponse({"error": f"Analysis failed: {str(e)}"}, status_code=500)
 
 
+async def _run_bounded(cmd, *, cwd=None, timeout=None, env=None, tail_bytes=65536):
+    """Run *cmd* capturing only the last *tail_bytes* of stdout/stderr.
+
+    Like subprocess.run(capture_output=True) but asynchronous and with
+    bounded memory: the event loop keeps serving other requests while a
+    long maintenance command runs, and a verbose command (e.g. the OUI
+    fetch) can print megabytes of which only the tail matters for status
+    parsing and error reporting.
+
+    Returns (returncode, stdout_text, stderr_text); raises
+    subprocess.TimeoutExpired like subprocess.run does.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, cwd=cwd, env=env,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE)
+
+    async def _drain_tail(stream) -> bytearray:
+        buf = bytearray()
+        while True:
+            chunk = await stream.read(65536)
+            if not chunk:
+                return buf
+            buf += chunk
+            if len(buf) > tail_bytes:
+                del buf[:len(buf) - tail_bytes]
+
+    try:
+        stdout, stderr = await asyncio.wait_for(
+            asyncio.gather(_drain_tail(proc.stdout), _drain_tail(proc.stderr)),
+            timeout)
+        rc = await proc.wait()
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout)
+
+    return rc, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
+
+# Matches the entry count reported by freeze_wifi_oui.py, compiled once
+_OUI_ENTRIES_RE = re.compile(r'(\d+)\s*OUI entries')
+
+
 @app.post("/api/oui/update")
 async def update_oui_database():
     """Update the WiFi OUI vendor database from IEEE registry."""
+    lock = _maintenance_lock("oui-update")
+    if lock.locked():
+        return JSONResponse({"error": "OUI update already in progress"}, status_code=409)
+
+    async with lock:
+        return await _update_oui_database_locked()
+
+
+async def _update_oui_database_locked():
     try:
-        import subprocess
-        import os
-        
         # Get path to freeze_wifi_oui.py script
         script_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
         script_path = os.path.join(script_dir, "freeze_wifi_oui.py")
@@ -1323,33 +2071,28 @@ async def update_oui_database():
             return JSONResponse({"error": "OUI update script not found"}, status_code=404)
         
         # Run the script
-        result = subprocess.run(
+        rc, stdout, stderr = await _run_bounded(
             ["python3", script_path],
-            capture_output=True,
-            text=True,
             timeout=120,  # 2 minute timeout
             cwd=script_dir
         )
-        
-        if result.returncode != 0:
-            error_msg = result.stderr or result.stdout or "Unknown error"
+
+        if rc != 0:
+            error_msg = stderr or stdout or "Unknown error"
             return JSONResponse({"error": f"Script failed: {error_msg}"}, status_code=500)
-        
-        # Parse output to get entry count
+
+        # Parse output to get entry count: one search over the whole output
+        # instead of splitting into lines and re-compiling the pattern
         entries = None
-        for line in result.stdout.split('\n'):
-            if 'OUI entries' in line:
-                import re
-                match = re.search(r'(\d+)\s*OUI entries', line)
-                if match:
-                    entries = int(match.group(1))
-                    break
-        
+        match = _OUI_ENTRIES_RE.search(stdout)
+        if match:
+            entries = int(match.group(1))
+
         return {
             "success": True,
             "message": "OUI database updated successfully",
             "entries": entries,
-            "output": result.stdout
+            "output": stdout
         }
     except subprocess.TimeoutExpired:
         return JSONResponse({"error": "OUI update timed out"}, status_code=504)
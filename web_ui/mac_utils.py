@@ -1,74 +1,99 @@
 """WiFi MAC address utilities for detecting and analyzing randomized MACs."""
 
+from functools import lru_cache
+
+
+# Second hex digit of the first octet when bit 1 (locally-administered)
+# is set: 2, 3, 6, 7, A, B, E, F in either case.
+_LOCAL_ADMIN_CHARS = frozenset("2367abefABEF")
+
 
 def is_locally_administered_mac(mac_str: str) -> bool:
     """Check if MAC address has locally-administered bit set (randomized).
-    
+
     Locally-administered MACs indicate the device is using MAC randomization.
     Bit 1 of the first octet: 0=universal, 1=locally administered.
-    
+
     Args:
         mac_str: MAC address string (e.g., "AA:BB:CC:DD:EE:FF")
-    
+
     Returns:
         True if MAC is locally administered (likely randomized)
     """
     try:
-        first_octet = int(mac_str.split(":")[0], 16)
-        return (first_octet & 0x02) != 0
+        return mac_str[1] in _LOCAL_ADMIN_CHARS
     except Exception:
         return False
 
 
+def _build_derand_table() -> tuple:
+    """Precompute de-randomization candidates for every possible first octet.
+
+    For each first-octet value, applies the known randomization-reversal
+    patterns (clear bit 1, clear bits 0+1, toggle bit 1) and stores the
+    distinct resulting octets as uppercase hex pairs. Built once at import
+    so the per-MAC lookup is a table probe plus string slicing instead of
+    int parsing and reformatting.
+    """
+    table = []
+    for octet in range(256):
+        candidates = []
+        for variant in (octet & ~0x02, octet & ~0x03, octet ^ 0x02):
+            hex_pair = f"{variant:02X}"
+            if hex_pair not in candidates:
+                candidates.append(hex_pair)
+        table.append(tuple(candidates))
+    return tuple(table)
+
+
+_DERAND_FIRST_OCTETS = _build_derand_table()
+
+
+@lru_cache(maxsize=65536)
 def lookup_randomized_mac_vendor(mac_str: str) -> tuple[str, bool]:
     """Attempt to identify vendor of a randomized MAC.
-    
+
     Tries multiple de-randomization patterns since devices use different strategies:
     - Clear bit 1 (locally-administered bit)
     - Clear bits 0 and 1 (common pattern)
     - Toggle bit 1 (alternative pattern)
-    
+
+    Candidate first octets come from a table precomputed at import, so each
+    attempt is built by string slicing rather than re-parsing the address.
+
     If vendor is found via de-randomization, returns it with [rand] marker.
     If MAC is randomized but vendor cannot be recovered, returns "[randomized]".
-    
+
     Args:
         mac_str: MAC address string (e.g., "AA:BB:CC:DD:EE:FF")
-    
+
     Returns:
         Tuple of (vendor_name, is_randomized):
-        - vendor_name: Vendor name with "[rand]" marker if de-randomized, 
+        - vendor_name: Vendor name with "[rand]" marker if de-randomized,
                       "[randomized]" if randomized but unrecoverable, or ""
         - is_randomized: True if MAC is locally-administered (randomized)
     """
     try:
         from wifi_oui_lookup import lookup_vendor
-        
+
         # First try direct lookup
         vendor = lookup_vendor(mac_str)
         if vendor:
             return vendor, False
-        
+
         # If not found and MAC is locally-administered, try de-randomization
         if is_locally_administered_mac(mac_str):
-            octets = mac_str.split(":")
-            first_octet = int(octets[0], 16)
-            
-            # Try multiple de-randomization patterns
-            patterns_to_try = [
-                first_octet & ~0x02,      # Clear bit 1 (locally-administered)
-                first_octet & ~0x03,      # Clear bits 0 and 1 (common pattern)
-                first_octet ^ 0x02,       # Toggle bit 1 (alternative)
-            ]
-            
-            for pattern_octet in patterns_to_try:
-                test_mac = f"{pattern_octet:02x}:{':'.join(octets[1:])}".upper()
-                vendor = lookup_vendor(test_mac)
+            first_octet = int(mac_str[:2], 16)
+            rest = mac_str[2:].upper()
+
+            for hex_pair in _DERAND_FIRST_OCTETS[first_octet]:
+                vendor = lookup_vendor(hex_pair + rest)
                 if vendor:
                     return f"{vendor} [rand]", True
-            
+
             # If still not found but is randomized, mark as anonymized
             return "[randomized]", True
-        
+
         return "", False
     except Exception:
         return "", False
@@ -17,27 +17,79 @@ Usage:
 """
 
 import os
+import queue
+import socket
+import struct
 import sys
 import signal
 import threading
 import time
 import subprocess
-from typing import Optional, Callable, Dict, Any
+from collections import OrderedDict
+from typing import Optional, Callable, Dict, Any, Tuple
 
 import gps_client as gc
-from storage import db, upsert_wifi_device, add_wifi_association
-from settings import KNOWN_WIFIS
+from storage import db, normalize_mac
+from settings import KNOWN_WIFIS, WIFI_WRITE_BATCH_MAX, WIFI_WRITE_FLUSH_INTERVAL
+
+# KNOWN_WIFIS is a list in settings; promote it to a frozenset once so the
+# per-packet membership test is O(1), or None when no filter is configured.
+# The bytes form lets the raw parser reject unknown SSIDs before paying
+# for a UTF-8 decode.
+_KNOWN_WIFIS_SET = frozenset(KNOWN_WIFIS) if KNOWN_WIFIS else None
+_KNOWN_WIFIS_BYTES = frozenset(s.encode() for s in KNOWN_WIFIS) if KNOWN_WIFIS else None
+
+# Writer-thread batching: upper bound on queued observations awaiting a
+# database write; batch size and flush cadence come from settings.
+_WRITE_QUEUE_MAX = 10000
+_WRITE_BATCH_MAX = WIFI_WRITE_BATCH_MAX
+_WRITE_FLUSH_INTERVAL = WIFI_WRITE_FLUSH_INTERVAL
+
+# Duplicate suppression: phones emit probe bursts of 5-10 frames per
+# channel scan; repeats of (mac, ssid, ~rssi) within the TTL are dropped
+# before they reach the write queue.
+_DEDUP_TTL = 10.0
+_DEDUP_MAX = 4096
+
+# GPS only updates at 1-10 Hz, so a sub-second cache is lossless while
+# probes can arrive at hundreds per second.
+_GPS_CACHE_TTL = 0.2
 
 try:
-    from scapy.all import sniff, Dot11, Dot11Elt, conf
+    from scapy.all import sniff, Dot11, Dot11Elt, RadioTap, conf
     from scapy.arch import get_if_hwaddr
 except ImportError:
     print("Error: scapy not installed. Install with: pip install scapy")
     sys.exit(1)
 
+try:
+    import pcap  # pypcap, optional: kernel-side BPF filtering when present
+except ImportError:
+    pcap = None
+
+# With libpcap the subtype filter runs in the kernel, so uninteresting
+# frames (data, control, other management) never cross into Python.
+_BPF_FILTER = "type mgt and (subtype probe-req or subtype beacon)"
+
+
+# ARPHRD_IEEE80211_RADIOTAP: /sys/class/net/<iface>/type reports this when
+# the interface is in monitor mode.
+_ARPHRD_RADIOTAP = 803
+
 
 def _is_monitor_mode(interface: str) -> bool:
-    """Check if interface is in monitor mode."""
+    """Check if interface is in monitor mode.
+
+    Reads the interface type from sysfs (sub-millisecond, no fork) and only
+    falls back to parsing iwconfig output where sysfs is unavailable.
+    """
+    try:
+        with open(f"/sys/class/net/{interface}/type") as f:
+            return int(f.read()) == _ARPHRD_RADIOTAP
+    except OSError:
+        pass
+    except ValueError:
+        return False
     try:
         result = subprocess.run(
             ["iwconfig", interface],
@@ -84,14 +136,162 @@ def _enable_monitor_mode(interface: str) -> bool:
     return False
 
 
+# Radiotap fields up to dBm antenna signal (bit 5): (size, alignment) per
+# bit, needed to skip preceding fields when locating the RSSI byte.
+_RADIOTAP_FIELDS = (
+    (8, 8),  # 0: TSFT
+    (1, 1),  # 1: Flags
+    (1, 1),  # 2: Rate
+    (4, 2),  # 3: Channel
+    (2, 2),  # 4: FHSS
+    (1, 1),  # 5: dBm antenna signal
+)
+
+_BROADCAST_MAC = b"\xff\xff\xff\xff\xff\xff"
+_NULL_MAC = b"\x00\x00\x00\x00\x00\x00"
+
+# Precompiled unpackers: struct.unpack_from parses the format string on
+# every call, and these run several times per captured frame.
+_UNPACK_U16 = struct.Struct("<H").unpack_from
+_UNPACK_U32 = struct.Struct("<I").unpack_from
+
+
+def _set_thread_scheduling(cpu: int, fifo_priority: Optional[int] = None) -> None:
+    """Best-effort CPU pinning and priority for the calling thread.
+
+    Capture loss under load is mostly the capture thread losing its core;
+    pinning it and the writer to different CPUs keeps them from fighting.
+    Everything here degrades silently — single-core hosts skip the pin and
+    SCHED_FIFO needs privileges the scanner may not have.
+    """
+    try:
+        if hasattr(os, "sched_setaffinity"):
+            cpus = os.sched_getaffinity(0)
+            if cpu in cpus and len(cpus) > 1:
+                os.sched_setaffinity(0, {cpu})
+    except OSError:
+        pass
+    if fifo_priority is not None and hasattr(os, "sched_setscheduler"):
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(fifo_priority))
+        except OSError:
+            pass
+
+
+def _parse_radiotap(buf: bytes) -> Optional[Tuple[int, Optional[int]]]:
+    """Parse a radiotap header, returning (header_length, rssi_dbm).
+
+    Walks the present-flag words (bit 31 chains extensions) and the
+    aligned field layout just far enough to pull the dBm antenna signal;
+    rssi is None when the capture driver did not include it.
+    """
+    if len(buf) < 8 or buf[0] != 0:
+        return None
+    it_len, = _UNPACK_U16(buf, 2)
+    if it_len > len(buf):
+        return None
+    # Present-flag words; bit 31 chains another word.
+    offset = 4
+    present, = _UNPACK_U32(buf, offset)
+    offset += 4
+    word = present
+    while word & 0x80000000:
+        if offset + 4 > it_len:
+            return None
+        word, = _UNPACK_U32(buf, offset)
+        offset += 4
+    rssi = None
+    pos = offset
+    for bit, (size, align) in enumerate(_RADIOTAP_FIELDS):
+        if not present & (1 << bit):
+            continue
+        pos += (-pos) % align  # fields are aligned to their natural size
+        if bit == 5:
+            if pos < it_len:
+                rssi = buf[pos] - 256 if buf[pos] > 127 else buf[pos]
+            break
+        pos += size
+    return it_len, rssi
+
+
+def _parse_probe(buf: bytes) -> Optional[Tuple[str, str, Optional[int], str]]:
+    """Extract (mac, ssid, rssi, frame_type) from a raw radiotap frame.
+
+    Pure-Python fast path for the AF_PACKET capture loop: checks the frame
+    control byte for management probe requests (subtype 4) and beacons
+    (subtype 8), then walks the information elements with a plain TLV loop
+    to find the SSID. Returns None for anything else, so non-management
+    traffic costs only a few byte comparisons.
+    """
+    parsed = _parse_radiotap(buf)
+    if parsed is None:
+        return None
+    hlen, rssi = parsed
+    return _parse_80211(buf, hlen, rssi)
+
+
+def _parse_80211(buf: bytes, hlen: int,
+                 rssi: Optional[int]) -> Optional[Tuple[str, str, Optional[int], str]]:
+    """Parse the 802.11 management frame starting at *hlen* (see _parse_probe).
+
+    Split out so link types without a radiotap header (DLT_IEEE802_11)
+    can enter directly with hlen=0 and no RSSI.
+    """
+    if len(buf) < hlen + 24:
+        return None
+    fc = buf[hlen]
+    if fc & 0x0C != 0x00:  # management frames only
+        return None
+    subtype = fc >> 4
+    if subtype == 4:  # Probe Request - addr2 is the client MAC
+        mac_raw = buf[hlen + 10:hlen + 16]
+        ies = hlen + 24
+        frame_type_label = "ProbeRequest"
+    elif subtype == 8:  # Beacon - addr3 is the BSSID
+        mac_raw = buf[hlen + 16:hlen + 22]
+        ies = hlen + 36  # skip 12 bytes of fixed beacon parameters
+        frame_type_label = "Beacon"
+    else:
+        return None
+    if mac_raw == _BROADCAST_MAC or mac_raw == _NULL_MAC:
+        return None
+    ssid = None
+    i = ies
+    end = len(buf)
+    while i + 2 <= end:
+        eid = buf[i]
+        length = buf[i + 1]
+        if eid == 0:  # SSID information element
+            raw_ssid = buf[i + 2:i + 2 + length]
+            # Filtered deployments: reject unknown SSIDs on the raw bytes,
+            # skipping the UTF-8 decode (hidden SSIDs pass, as below).
+            if raw_ssid and _KNOWN_WIFIS_BYTES is not None and raw_ssid not in _KNOWN_WIFIS_BYTES:
+                return None
+            ssid = raw_ssid.decode("utf-8", errors="ignore")
+            if not ssid:  # Hidden SSID
+                ssid = "<hidden>"
+            break
+        i += 2 + length
+    if not ssid:
+        return None
+    return mac_raw.hex(":"), ssid, rssi, frame_type_label
+
+
 class _WiFiScanner:
     def __init__(self, interface: str, scanner_name: str = "WiFi Scanner"):
         self.interface = interface
         self.scanner_name = scanner_name
         self._stop = threading.Event()
         self._thread: Optional[threading.Thread] = None
+        self._writer: Optional[threading.Thread] = None
+        self._write_queue: "queue.Queue" = queue.Queue(maxsize=_WRITE_QUEUE_MAX)
+        self._log_queue: "queue.Queue" = queue.Queue(maxsize=1000)
+        self._log_thread: Optional[threading.Thread] = None
+        self._dedup: "OrderedDict" = OrderedDict()
+        self._gps_cache: Tuple[float, Any, Any] = (0.0, None, None)
         self._packet_count = 0
-        self._lock = threading.Lock()
+        self._drop_count = 0
+        self._monitor_ok = False
 
     def start(self) -> None:
         """Start capturing WiFi packets in background thread."""
@@ -105,6 +305,10 @@ class _WiFiScanner:
             return
         
         self._stop.clear()
+        self._writer = threading.Thread(target=self._writer_loop, name="wifi-writer", daemon=True)
+        self._writer.start()
+        self._log_thread = threading.Thread(target=self._log_loop, name="wifi-log", daemon=True)
+        self._log_thread.start()
         self._thread = threading.Thread(target=self._run, name="wifi-scanner", daemon=True)
         self._thread.start()
         print(f"WiFi scanner started on {self.interface}")
@@ -114,42 +318,225 @@ class _WiFiScanner:
         self._stop.set()
         if self._thread:
             self._thread.join(timeout=2.0)
+        if self._writer:
+            self._writer.join(timeout=2.0)
+        if self._log_thread:
+            self._log_thread.join(timeout=2.0)
         print(f"WiFi scanner stopped. Captured {self._packet_count} packets.")
 
     def _check_interface(self) -> bool:
-        """Check if interface is in monitor mode, enable if needed."""
+        """Check if interface is in monitor mode, enable if needed.
+
+        The positive result is cached: once the interface has been seen in
+        monitor mode, scanner restarts skip the check (now a sysfs read,
+        previously up to five subprocess calls and two sleeps).
+        """
+        if self._monitor_ok:
+            return True
+
         # First check if already in monitor mode
         if _is_monitor_mode(self.interface):
             print(f"✓ WiFi interface {self.interface} is in monitor mode")
+            self._monitor_ok = True
             return True
-        
+
         # Try to enable monitor mode
         print(f"⚠ WiFi interface {self.interface} is not in monitor mode, attempting to enable...")
         if _enable_monitor_mode(self.interface):
             print(f"✓ Monitor mode enabled on {self.interface}")
+            self._monitor_ok = True
             return True
-        
+
         return False
 
     def _run(self) -> None:
-        """Main packet capture loop."""
+        """Main packet capture loop.
+
+        Prefers a raw AF_PACKET socket with the minimal radiotap/TLV parser
+        above — scapy decodes every frame into layer objects before the
+        callback runs, which dominates CPU at high probe rates. Falls back
+        to scapy sniff when raw capture is unavailable.
+        """
+        _set_thread_scheduling(0, fifo_priority=20)
         try:
+            if pcap is not None:
+                try:
+                    self._run_pcap()
+                    return
+                except PermissionError:
+                    raise
+                except Exception as e:
+                    print(f"pcap capture unavailable ({e}), trying raw socket")
+
+            if hasattr(socket, "AF_PACKET"):
+                try:
+                    self._run_raw()
+                    return
+                except PermissionError:
+                    raise
+                except OSError as e:
+                    print(f"Raw capture unavailable ({e}), falling back to scapy")
+
             # Suppress verbose scapy output
             conf.verb = 0
-            
-            # Start sniffing
-            sniff(
-                iface=self.interface,
-                prn=self._packet_callback,
-                stop_filter=lambda x: self._stop.is_set(),
-                store=False,
-                monitor=True,
-            )
+
+            # Start sniffing. The BPF filter keeps data/control frames in
+            # the kernel; some monitor-mode drivers reject BPF, so retry
+            # unfiltered rather than not capturing at all.
+            try:
+                self._sniff_scapy(_BPF_FILTER)
+            except Exception:
+                if self._stop.is_set():
+                    return
+                print(f"BPF filter rejected on {self.interface}, sniffing unfiltered")
+                self._sniff_scapy(None)
         except PermissionError:
             print(f"Error: Need root/sudo to capture on {self.interface}")
         except Exception as e:
             print(f"WiFi scanner error: {e}")
 
+    def _sniff_scapy(self, bpf: Optional[str]) -> None:
+        """scapy capture over an explicitly opened socket.
+
+        Opening conf.L2listen ourselves lets us grow SO_RCVBUF to 16 MiB so
+        the kernel absorbs probe bursts while the callback runs, and the
+        short sniff timeouts replace the per-packet stop_filter lambda —
+        the stop flag is checked once a second instead of once a frame.
+        """
+        sock = conf.L2listen(iface=self.interface, monitor=True, filter=bpf)
+        try:
+            try:
+                sock.ins.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 16 * 1024 * 1024)
+            except (AttributeError, OSError):
+                pass
+            while not self._stop.is_set():
+                sniff(
+                    opened_socket=sock,
+                    prn=self._packet_callback,
+                    store=False,
+                    timeout=1.0,
+                )
+        finally:
+            sock.close()
+
+    def _run_pcap(self) -> None:
+        """Capture via libpcap with the management-subtype filter in the kernel.
+
+        readpkts() hands back a batch of (timestamp, buffer) pairs per wakeup,
+        so the Python loop only runs for frames that already passed the BPF
+        program; everything else stays in the kernel.
+        """
+        p = pcap.pcap(name=self.interface, promisc=True, immediate=False, timeout_ms=100)
+        p.setfilter(_BPF_FILTER)
+        # Branch on the link type once: DLT_IEEE802_11 (105) delivers bare
+        # 802.11 frames, so skip the radiotap walk entirely (no RSSI there);
+        # DLT_IEEE802_11_RADIO (127) goes through the radiotap parser.
+        datalink = p.datalink()
+        if datalink == 105:
+            parse = lambda buf: _parse_80211(buf, 0, None)
+        elif datalink == 127:
+            parse = _parse_probe
+        else:
+            raise OSError(f"unsupported pcap datalink {datalink}")
+        while not self._stop.is_set():
+            for _ts, buf in p.readpkts():
+                parsed = parse(bytes(buf))
+                if parsed is not None:
+                    self._handle_observation(*parsed)
+
+    def _run_raw(self) -> None:
+        """Capture loop reading radiotap frames straight off an AF_PACKET socket."""
+        sock = socket.socket(socket.AF_PACKET, socket.SOCK_RAW, socket.htons(0x0003))
+        try:
+            sock.bind((self.interface, 0))
+            sock.settimeout(1.0)
+            while not self._stop.is_set():
+                try:
+                    buf = sock.recv(4096)
+                except socket.timeout:
+                    continue
+                parsed = _parse_probe(buf)
+                if parsed is not None:
+                    self._handle_observation(*parsed)
+        finally:
+            sock.close()
+
+    def _writer_loop(self) -> None:
+        """Drain the write queue and flush observations in batched transactions.
+
+        _packet_callback used to open a transaction per packet, so every probe
+        request paid a WAL commit and two b-tree descents. The writer thread
+        instead collects up to _WRITE_BATCH_MAX queued observations (waiting at
+        most _WRITE_FLUSH_INTERVAL for the first one) and writes each batch with
+        executemany inside a single transaction, amortizing the commit cost
+        across the whole batch.
+        """
+        _set_thread_scheduling(1)
+        reported_drops = 0
+        last_drop_report = time.time()
+        while not self._stop.is_set() or not self._write_queue.empty():
+            # Report backpressure drops at most once a second, from here
+            # rather than per-drop on the capture thread.
+            if self._drop_count != reported_drops:
+                now = time.time()
+                if now - last_drop_report >= 1.0:
+                    delta = self._drop_count - reported_drops
+                    reported_drops = self._drop_count
+                    last_drop_report = now
+                    print(f"[WiFi] write queue saturated: dropped {delta} observations")
+            try:
+                batch = [self._write_queue.get(timeout=_WRITE_FLUSH_INTERVAL)]
+            except queue.Empty:
+                continue
+            while len(batch) < _WRITE_BATCH_MAX:
+                try:
+                    batch.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._flush_batch(batch)
+            except Exception as e:
+                print(f"WiFi writer error: {e}")
+
+    def _log_loop(self) -> None:
+        """Emit queued console messages so stdio latency stays off the capture thread.
+
+        Messages accumulated since the last wakeup are joined and written
+        with one stdout write/flush pair instead of a flush per print.
+        """
+        write = sys.stdout.write
+        flush = sys.stdout.flush
+        while not self._stop.is_set() or not self._log_queue.empty():
+            try:
+                lines = [self._log_queue.get(timeout=0.25)]
+            except queue.Empty:
+                continue
+            while len(lines) < 100:
+                try:
+                    lines.append(self._log_queue.get_nowait())
+                except queue.Empty:
+                    break
+            lines.append("")  # trailing newline for the join
+            write("\n".join(lines))
+            flush()
+
+    def _flush_batch(self, batch) -> None:
+        """Write one batch of (mac, ssid, ts, ts_gps, lat, lon, alt, rssi, type) rows."""
+        with db() as con:
+            con.execute("BEGIN IMMEDIATE;")
+            con.executemany("""
+                INSERT INTO wifi_devices(mac, first_seen, last_seen, vendor)
+                VALUES (?, ?, ?, NULL)
+                ON CONFLICT(mac) DO UPDATE SET last_seen=excluded.last_seen;
+            """, [(mac, ts, ts) for mac, _, ts, _, _, _, _, _, _ in batch])
+            con.executemany("""
+                INSERT INTO wifi_associations(
+                    mac, ts_unix, ts_gps, lat, lon, alt, ssid, packet_type, rssi, scanner_name
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?);
+            """, [(mac, ts, ts_gps, lat, lon, alt, ssid, ptype, rssi, self.scanner_name)
+                  for mac, ssid, ts, ts_gps, lat, lon, alt, rssi, ptype in batch])
+            con.execute("COMMIT;")
+
     def _packet_callback(self, pkt) -> None:
         """Process captured packet.
         
@@ -157,91 +544,110 @@ class _WiFiScanner:
         - Probe Requests (subtype 4): Devices searching for networks
         - Beacon Frames (subtype 8): AP advertisements (e.g., phone hotspots)
         """
-        if self._stop.is_set():
-            return
-        
         try:
-            # Only process packets with Dot11 (802.11) layer
-            if not pkt.haslayer(Dot11):
+            # Resolve each scapy layer once; repeated haslayer/__getattr__
+            # walks are the hottest part of the dissection path.
+            dot11 = pkt.getlayer(Dot11)
+            if dot11 is None:
                 return
-            
+
             # Filter by frame subtype: 4=ProbeRequest, 8=Beacon
-            frame_subtype = pkt.subtype
+            frame_subtype = dot11.subtype
             if frame_subtype == 4:  # Probe Request - client device
-                mac = pkt.addr2  # Source: client device MAC
+                mac = dot11.addr2  # Source: client device MAC
                 frame_type_label = "ProbeRequest"
             elif frame_subtype == 8:  # Beacon - AP advertisement
-                mac = pkt.addr3  # BSSID: AP MAC address
+                mac = dot11.addr3  # BSSID: AP MAC address
                 frame_type_label = "Beacon"
             else:
                 return  # Ignore other frame subtypes
-            
+
             # Skip broadcast/null MACs
             if not mac or mac == "ff:ff:ff:ff:ff:ff" or mac == "00:00:00:00:00:00":
                 return
-            
-            # Parse SSID and other info from probe/beacon frames
+
+            # Extract the SSID: it is mandated to be the first information
+            # element in probe requests and beacons, so one getlayer call
+            # suffices — no need to walk the whole IE chain.
             ssid = None
-            signal_strength = None
-            
-            # Extract SSID from Dot11Elt (information elements)
-            if pkt.haslayer(Dot11Elt):
-                for elt in pkt[Dot11Elt]:
-                    if elt.ID == 0:  # SSID information element
-                        try:
-                            ssid = elt.info.decode("utf-8", errors="ignore")
-                            if not ssid:  # Hidden SSID
-                                ssid = "<hidden>"
-                        except Exception:
-                            ssid = "<hidden>"
-                    elif elt.ID == 3:  # Channel
-                        pass
-            
+            elt = pkt.getlayer(Dot11Elt)
+            if elt is not None and elt.ID == 0:
+                try:
+                    ssid = elt.info.decode("utf-8", errors="ignore")
+                    if not ssid:  # Hidden SSID
+                        ssid = "<hidden>"
+                except Exception:
+                    ssid = "<hidden>"
+
             # Skip if no SSID found
             if not ssid:
                 return
-            
+
+            # Get signal strength (dBm)
+            rt = pkt.getlayer(RadioTap)
+            signal_strength = getattr(rt, "dBm_AntSignal", None) if rt is not None else None
+
+            self._handle_observation(mac, ssid, signal_strength, frame_type_label)
+
+        except Exception as e:
+            # Silently continue on malformed packets
+            pass
+
+    def _handle_observation(self, mac: str, ssid: str,
+                            signal_strength: Optional[int],
+                            frame_type_label: str) -> None:
+        """Filter, geotag and enqueue one observation (shared by both capture paths)."""
+        try:
             # Filter by known SSIDs if configured
-            if KNOWN_WIFIS and ssid != "<hidden>" and ssid not in KNOWN_WIFIS:
+            if _KNOWN_WIFIS_SET is not None and ssid != "<hidden>" and ssid not in _KNOWN_WIFIS_SET:
                 return
-            
-            # Get signal strength (dBm)
-            signal_strength = pkt.dBm_AntSignal if hasattr(pkt, "dBm_AntSignal") else None
-            
-            # Get GPS data
+
             now = time.time()
-            gps_loc = gc.get_location()
-            gps_time = gc.get_gps_time()
-            
+
+            # Suppress rapid repeats: same device, same SSID, roughly the
+            # same signal (5 dB buckets) within the TTL adds no information.
+            key = (mac, ssid, (signal_strength or 0) // 5)
+            dedup = self._dedup
+            if dedup.get(key, 0.0) > now - _DEDUP_TTL:
+                return
+            dedup[key] = now
+            dedup.move_to_end(key)
+            while len(dedup) > _DEDUP_MAX:
+                dedup.popitem(last=False)
+
+            # Get GPS data (cached: the fix changes far slower than probes arrive)
+            cached_at, gps_loc, gps_time = self._gps_cache
+            if now - cached_at > _GPS_CACHE_TTL:
+                gps_loc, gps_time = gc.get_snapshot()
+                self._gps_cache = (now, gps_loc, gps_time)
+
             lat = gps_loc.lat if gps_loc else None
             lon = gps_loc.lon if gps_loc else None
             alt = gps_loc.alt if gps_loc else None
             ts_gps = gps_time
-            
-            # Store in database
-            with db() as con:
-                upsert_wifi_device(con, mac, now=int(now))
-                add_wifi_association(
-                    con,
-                    mac=mac,
-                    ssid=ssid,
-                    ts_unix=int(now),
-                    ts_gps=ts_gps,
-                    lat=lat,
-                    lon=lon,
-                    alt=alt,
-                    rssi=signal_strength,
-                    scanner=self.scanner_name,
-                    packet_type=frame_type_label,
-                )
-            
-            # Console output
-            with self._lock:
-                self._packet_count += 1
-                print(f"[WiFi] {frame_type_label} {mac} -> {ssid} (RSSI: {signal_strength})")
-        
-        except Exception as e:
-            # Silently continue on malformed packets
+
+            # Hand off to the writer thread; drop the observation if the
+            # queue is full rather than stalling the capture loop.
+            try:
+                self._write_queue.put_nowait((
+                    normalize_mac(mac), ssid, int(now), ts_gps,
+                    lat, lon, alt, signal_strength, frame_type_label,
+                ))
+            except queue.Full:
+                self._drop_count += 1
+                return
+
+            # Console output goes through the log queue so the capture
+            # thread never blocks on stdio; only this thread increments
+            # the counter, so no lock is needed.
+            self._packet_count += 1
+            try:
+                self._log_queue.put_nowait(
+                    f"[WiFi] {frame_type_label} {mac} -> {ssid} (RSSI: {signal_strength})")
+            except queue.Full:
+                pass
+
+        except Exception:
             pass
 
 
@@ -272,11 +678,12 @@ def stop_wifi_scan() -> None:
 def get_wifi_status() -> Dict[str, Any]:
     """Get current WiFi scanner status."""
     if _scanner is None:
-        return {"status": "not_initialized", "packet_count": 0}
+        return {"status": "not_initialized", "packet_count": 0, "drops": 0}
     return {
         "status": "running" if _scanner._thread and _scanner._thread.is_alive() else "stopped",
         "interface": _scanner.interface,
         "packet_count": _scanner._packet_count,
+        "drops": _scanner._drop_count,
     }
 
 